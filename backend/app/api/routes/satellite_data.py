@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import datetime, timedelta
@@ -42,7 +43,8 @@ async def list_satellite_images(
         )
         
         images = await get_satellite_images(db, query)
-        return images
+        # DTOs are serialized by orjson directly; response_model only documents the schema
+        return ORJSONResponse(content=images)
     except Exception as e:
         logger.error(f"Error retrieving satellite images: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving satellite images: {str(e)}")
@@ -59,7 +61,7 @@ async def get_satellite_image(
         image = await get_satellite_image_by_id(db, image_id)
         if not image:
             raise HTTPException(status_code=404, detail=f"Satellite image with ID {image_id} not found")
-        return image
+        return ORJSONResponse(content=image)
     except HTTPException:
         raise
     except Exception as e:
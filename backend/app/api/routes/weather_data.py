@@ -1,18 +1,19 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any, Literal
 from datetime import datetime
 import logging
+import orjson
 
 from app.db.session import get_db
 from app.services.weather_service import (
-    get_weather_data, 
+    stream_weather_data, 
     get_weather_data_by_id, 
     get_weather_statistics,
     get_weather_heatmap_data
 )
 from app.schemas.weather import (
-    WeatherDataResponse, 
     WeatherDataQuery,
     WeatherStatsResponse
 )
@@ -20,7 +21,23 @@ from app.schemas.weather import (
 router = APIRouter(prefix="/weather", tags=["weather"])
 logger = logging.getLogger(__name__)
 
-@router.get("/data", response_model=List[WeatherDataResponse])
+async def _encode_json_array(
+    first: Optional[Dict[str, Any]],
+    items: AsyncIterator[Dict[str, Any]]
+) -> AsyncIterator[bytes]:
+    """
+    Encode an already-fetched first item and the rest of an async stream of
+    dicts as a JSON array, one chunk per item
+    """
+    yield b"["
+    if first is not None:
+        yield orjson.dumps(first)
+        async for item in items:
+            yield b","
+            yield orjson.dumps(item)
+    yield b"]"
+
+@router.get("/data", response_model=None)
 async def list_weather_data(
     data_type: Optional[str] = None,
     source: Optional[str] = None,
@@ -36,7 +53,7 @@ async def list_weather_data(
     bbox_min_lat: Optional[float] = Query(None, description="Minimum latitude of bounding box"),
     bbox_max_lon: Optional[float] = Query(None, description="Maximum longitude of bounding box"),
     bbox_max_lat: Optional[float] = Query(None, description="Maximum latitude of bounding box"),
-    order_by: Optional[str] = Query("newest", description="Order results by date: 'newest' or 'oldest'"),
+    order_by: Literal['newest', 'oldest'] = Query("newest", description="Order results by date: 'newest' or 'oldest'"),
     offset: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     db: AsyncSession = Depends(get_db)
@@ -69,9 +86,14 @@ async def list_weather_data(
         
         logger.info(f"Weather data query: {query}")
         
-        # Call service to get data
-        weather_data = await get_weather_data(db, query)
-        return weather_data
+        # Run the query and fetch the first row before the response starts, so
+        # query and connection errors still become a 500 here. Errors after
+        # that can only cut the stream short; the service logs them.
+        rows = stream_weather_data(db, query)
+        try:
+            first = await rows.__anext__()
+        except StopAsyncIteration:
+            first = None
     
     except Exception as e:
         logger.error(f"Error retrieving weather data: {e}", exc_info=True)
@@ -79,8 +101,14 @@ async def list_weather_data(
             status_code=500,
             detail=f"An error occurred while retrieving weather data: {str(e)}"
         )
+    
+    # Stream the remaining rows out as they arrive from the database
+    return StreamingResponse(
+        _encode_json_array(first, rows),
+        media_type="application/json"
+    )
 
-@router.get("/data/{weather_id}", response_model=WeatherDataResponse)
+@router.get("/data/{weather_id}", response_model=None)
 async def get_weather_data_point(
     weather_id: int,
     db: AsyncSession = Depends(get_db)
@@ -118,7 +146,7 @@ async def get_weather_stats(
     bbox_max_lat: float = Query(..., description="Maximum latitude of bounding box"),
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-    interval: str = Query("daily", description="Time interval for aggregation (hourly, daily, weekly, monthly)"),
+    interval: Literal['hourly', 'daily', 'weekly', 'monthly'] = Query("daily", description="Time interval for aggregation (hourly, daily, weekly, monthly)"),
     db: AsyncSession = Depends(get_db)
 ):
     """
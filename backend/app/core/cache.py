@@ -0,0 +1,63 @@
+import functools
+import hashlib
+import logging
+from typing import Any, Awaitable, Callable
+
+import orjson
+from redis import asyncio as aioredis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+redis_client = aioredis.Redis(host=settings.REDIS_HOST, port=settings.REDIS_PORT)
+
+def _default(obj: Any) -> Any:
+    """
+    orjson fallback for Pydantic models returned by services
+    """
+    if hasattr(obj, "dict"):
+        return obj.dict()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def redis_cached(prefix: str, ttl: int = settings.CACHE_TTL_SECONDS) -> Callable:
+    """
+    Cache the JSON-serializable result of an async service function in Redis
+    
+    The wrapped function must take the database session as its first argument;
+    every other argument goes into the cache key. On a hit the decoded JSON is
+    returned, so callers must accept plain dicts in place of Pydantic models.
+    Redis errors are logged and the function is called as if uncached.
+    
+    Args:
+        prefix: Key prefix identifying the cached function
+        ttl: Time to live of cached entries, in seconds
+        
+    Returns:
+        Decorator for async service functions
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(func)
+        async def wrapper(db, *args, **kwargs):
+            key_parts = orjson.dumps([args, kwargs], option=orjson.OPT_SORT_KEYS)
+            key = f"{prefix}:{hashlib.blake2b(key_parts, digest_size=16).hexdigest()}"
+            
+            try:
+                cached = await redis_client.get(key)
+                if cached is not None:
+                    return orjson.loads(cached)
+            except Exception as e:
+                logger.warning(f"Redis lookup failed for {key}: {e}")
+            
+            result = await func(db, *args, **kwargs)
+            
+            try:
+                await redis_client.setex(key, ttl, orjson.dumps(result, default=_default))
+            except Exception as e:
+                logger.warning(f"Redis store failed for {key}: {e}")
+            
+            return result
+        
+        return wrapper
+    
+    return decorator
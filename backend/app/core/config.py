@@ -9,21 +9,35 @@ class Settings(BaseSettings):
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "VisionEarth API"
     
-    # CORS settings
-    BACKEND_CORS_ORIGINS: List[str] = ["*"]
+    # CORS settings. Origins must be explicit since credentials are allowed;
+    # override with a JSON list, e.g. BACKEND_CORS_ORIGINS='["https://app.example.com"]'
+    BACKEND_CORS_ORIGINS: List[str] = ["http://localhost:3000"]
+    CORS_MAX_AGE: int = int(os.getenv("CORS_MAX_AGE", "86400"))  # Preflight cache lifetime in seconds
     
     # Authentication
     SECRET_KEY: str = os.getenv("SECRET_KEY", "supersecretkey")  # Change in production
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
-    # Database
+    # Uvicorn worker processes. Each worker has its own DB pool, Redis client
+    # and JIT caches, so resources scale with this rather than the core count.
+    WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", "2"))
+    
+    # Database. Every worker opens its own pool, so
+    # (DB_POOL_SIZE + DB_MAX_OVERFLOW) * WEB_CONCURRENCY must stay below the
+    # server's max_connections (100 by default in PostgreSQL). By default the
+    # pool and overflow split DB_CONNECTION_BUDGET evenly across the workers.
     POSTGRES_SERVER: str = os.getenv("POSTGRES_SERVER", "localhost")
     POSTGRES_USER: str = os.getenv("POSTGRES_USER", "postgres")
     POSTGRES_PASSWORD: str = os.getenv("POSTGRES_PASSWORD", "postgres")
     POSTGRES_DB: str = os.getenv("POSTGRES_DB", "visionearth")
     POSTGRES_PORT: str = os.getenv("POSTGRES_PORT", "5432")
     SQLALCHEMY_DATABASE_URI: Optional[PostgresDsn] = None
+    DB_CONNECTION_BUDGET: int = int(os.getenv("DB_CONNECTION_BUDGET", "80"))  # Across all workers
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", max(1, DB_CONNECTION_BUDGET // WEB_CONCURRENCY // 2)))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", max(0, DB_CONNECTION_BUDGET // WEB_CONCURRENCY - DB_POOL_SIZE)))
+    DB_WARM_CONNECTIONS: int = int(os.getenv("DB_WARM_CONNECTIONS", "2"))  # Opened per worker at startup
+    DB_STATEMENT_CACHE_SIZE: int = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "1024"))
 
     @validator("SQLALCHEMY_DATABASE_URI", pre=True)
     def assemble_db_connection(cls, v: Optional[str], values: Dict[str, Any]) -> Any:
@@ -47,6 +61,15 @@ class Settings(BaseSettings):
     # Redis for caching
     REDIS_HOST: str = os.getenv("REDIS_HOST", "localhost")
     REDIS_PORT: int = int(os.getenv("REDIS_PORT", "6379"))
+    CACHE_TTL_SECONDS: int = int(os.getenv("CACHE_TTL_SECONDS", "300"))
+    
+    # Heatmap interpolation: 'database' runs IDW in PostGIS (only the grid is
+    # transferred), 'python' fetches the observations and interpolates with NumPy
+    HEATMAP_INTERPOLATION: str = os.getenv("HEATMAP_INTERPOLATION", "database")
+    
+    # Serve statistics from the weather_hourly TimescaleDB continuous aggregate
+    # (database/timescale.sql) instead of raw weather_data rows
+    WEATHER_HOURLY_AGGREGATE: bool = os.getenv("WEATHER_HOURLY_AGGREGATE", "false").lower() == "true"
     
     # AI Model settings
     MODEL_PATH: str = os.getenv("MODEL_PATH", "models/")
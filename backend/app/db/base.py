@@ -1,17 +1,56 @@
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+import asyncio
+import logging
 
 from app.core.config import settings
 
-# Create async engine
-engine = create_async_engine(str(settings.SQLALCHEMY_DATABASE_URI), echo=True)
+logger = logging.getLogger(__name__)
+
+# Create async engine. AsyncAdaptedQueuePool is the asyncio-safe pool; the
+# asyncpg statement caches let repeated queries skip re-preparing.
+engine = create_async_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI),
+    echo=True,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    connect_args={
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    },
+)
 
 # Create async session factory
 async_session = sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
+async def warm_up_pool() -> int:
+    """
+    Open a few connections up front so the first requests don't pay for connecting
+    
+    Failures are logged rather than raised, so the app still starts (and
+    connects lazily) when the database isn't reachable yet.
+    
+    Returns:
+        Number of connections opened
+    """
+    async def _connect():
+        async with engine.connect():
+            pass
+    
+    count = min(settings.DB_WARM_CONNECTIONS, settings.DB_POOL_SIZE)
+    results = await asyncio.gather(*(_connect() for _ in range(count)), return_exceptions=True)
+    
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        logger.warning(f"Failed to open {len(errors)} of {count} database connections at startup: {errors[0]}")
+    return count - len(errors)
+
 # Create declarative base
 Base = declarative_base()
 
@@ -1,7 +1,7 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Boolean, Text, Index
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Boolean, Text, Index, cast
 from sqlalchemy.dialects.postgresql import JSONB, ARRAY
 from sqlalchemy.orm import relationship
-from geoalchemy2 import Geometry
+from geoalchemy2 import Geometry, Geography
 from datetime import datetime
 
 from app.db.base import Base
@@ -43,6 +43,8 @@ class WeatherData(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     source = Column(String, index=True)  # e.g., "noaa", "meteostat"
+    station_id = Column(String)
+    station_name = Column(String)
     timestamp = Column(DateTime, index=True)
     data_type = Column(String, index=True)  # e.g., "temperature", "precipitation"
     value = Column(Float)
@@ -57,6 +59,10 @@ class WeatherData(Base):
         Index('idx_weather_data_timestamp', timestamp),
         Index('idx_weather_data_type', data_type),
         Index('idx_weather_data_location', location, postgresql_using='gist'),
+        # Backs meter-based ST_DWithin radius queries on location::geography
+        Index('idx_weather_data_location_geog', cast(location, Geography(geometry_type=None)), postgresql_using='gist'),
+        Index('idx_weather_data_timestamp_brin', timestamp, postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
+        Index('idx_weather_data_type_timestamp', data_type, timestamp),
     )
     
     def __repr__(self):
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
+from dataclasses import dataclass
 from datetime import datetime
 from geojson import Polygon, Point
 
@@ -36,6 +37,26 @@ class SatelliteImageResponse(SatelliteImageBase):
     class Config:
         orm_mode = True
 
+@dataclass(slots=True, frozen=True)
+class SatelliteImageDTO:
+    """
+    Read-path mirror of SatelliteImageResponse.
+
+    Rows loaded from the database are already typed, so the read endpoints build
+    these instead of Pydantic models and hand them straight to orjson. The
+    Pydantic model is kept for OpenAPI schema generation.
+    """
+    id: int
+    source: str
+    acquisition_date: datetime
+    cloud_cover_percentage: float
+    resolution: float
+    bands: List[str]
+    path: str
+    footprint: Dict[str, Any]  # GeoJSON Polygon
+    center_point: Dict[str, Any]  # GeoJSON Point
+    metadata: Dict[str, Any]
+
 class SatelliteImageStats(BaseModel):
     total_images: int
     images_by_source: Dict[str, int]
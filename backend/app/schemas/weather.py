@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, validator
-from typing import List, Optional, Dict, Any, Union
+from pydantic import BaseModel, Extra, Field, validator
+from typing import List, Optional, Dict, Any, Union, Literal
 from datetime import datetime
 from geojson_pydantic import Point, Polygon
 
@@ -84,16 +84,10 @@ class WeatherDataQuery(BaseModel):
     station_id: Optional[str] = None
     min_value: Optional[float] = None
     max_value: Optional[float] = None
-    order_by: str = 'newest'  # 'newest', 'oldest'
+    order_by: Literal['newest', 'oldest'] = 'newest'
     offset: int = 0
     limit: int = 100
     
-    @validator('order_by')
-    def validate_order_by(cls, v):
-        if v not in ['newest', 'oldest']:
-            raise ValueError('order_by must be either "newest" or "oldest"')
-        return v
-    
     @validator('bbox')
     def validate_bbox(cls, v):
         if v is not None:
@@ -109,6 +103,9 @@ class WeatherDataQuery(BaseModel):
         return v
     
     class Config:
+        # Query models are built once per request and never mutated
+        frozen = True
+        extra = Extra.forbid
         schema_extra = {
             "example": {
                 "data_type": "temperature",
@@ -141,7 +138,7 @@ class WeatherStatsResponse(BaseModel):
     data_type: str
     start_date: datetime
     end_date: datetime
-    interval: str  # 'hourly', 'daily', 'weekly', 'monthly'
+    interval: Literal['hourly', 'daily', 'weekly', 'monthly']
     unit: str
     bbox: List[float]  # [min_lon, min_lat, max_lon, max_lat]
     time_series: List[TimeSeriesPoint]
@@ -203,6 +200,8 @@ class WeatherForecastRequest(BaseModel):
         return v
     
     class Config:
+        frozen = True
+        extra = Extra.forbid
         schema_extra = {
             "example": {
                 "lat": 37.7749,
@@ -3,20 +3,24 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import func, and_, or_
+from sqlalchemy import func, and_, or_, bindparam
 from geoalchemy2.shape import from_shape, to_shape
 from shapely.geometry import box, mapping
 import json
 
 from app.models.spatial_data import SatelliteImage
-from app.schemas.satellite import SatelliteImageQuery, SatelliteImageResponse
+from app.schemas.satellite import SatelliteImageQuery, SatelliteImageDTO
 
 logger = logging.getLogger(__name__)
 
+# Built once so every by-id lookup emits identical SQL and reuses the
+# server-side prepared statement
+_GET_BY_ID_STMT = select(SatelliteImage).where(SatelliteImage.id == bindparam('image_id'))
+
 async def get_satellite_images(
     db: AsyncSession, 
     query: SatelliteImageQuery
-) -> List[SatelliteImageResponse]:
+) -> List[SatelliteImageDTO]:
     """
     Retrieve satellite images based on filtering criteria
     
@@ -74,8 +78,8 @@ async def get_satellite_images(
             center_point_shape = to_shape(image.center_point)
             center_point_geojson = mapping(center_point_shape)
             
-            # Convert to response model
-            response = SatelliteImageResponse(
+            # Convert to read-path DTO (DB columns are already typed, skip validation)
+            response = SatelliteImageDTO(
                 id=image.id,
                 source=image.source,
                 acquisition_date=image.acquisition_date,
@@ -99,7 +103,7 @@ async def get_satellite_images(
 async def get_satellite_image_by_id(
     db: AsyncSession, 
     image_id: int
-) -> Optional[SatelliteImageResponse]:
+) -> Optional[SatelliteImageDTO]:
     """
     Get a specific satellite image by ID
     
@@ -111,11 +115,8 @@ async def get_satellite_image_by_id(
         Satellite image if found, None otherwise
     """
     try:
-        # Build query
-        stmt = select(SatelliteImage).where(SatelliteImage.id == image_id)
-        
         # Execute query
-        result = await db.execute(stmt)
+        result = await db.execute(_GET_BY_ID_STMT, {'image_id': image_id})
         image = result.scalars().first()
         
         if not image:
@@ -129,8 +130,8 @@ async def get_satellite_image_by_id(
         center_point_shape = to_shape(image.center_point)
         center_point_geojson = mapping(center_point_shape)
         
-        # Convert to response model
-        response = SatelliteImageResponse(
+        # Convert to read-path DTO (DB columns are already typed, skip validation)
+        response = SatelliteImageDTO(
             id=image.id,
             source=image.source,
             acquisition_date=image.acquisition_date,
@@ -153,7 +154,7 @@ async def get_satellite_image_by_id(
 async def create_satellite_image(
     db: AsyncSession, 
     image_data: Dict[str, Any]
-) -> SatelliteImageResponse:
+) -> SatelliteImageDTO:
     """
     Create a new satellite image record
     
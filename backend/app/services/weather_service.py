@@ -1,113 +1,307 @@
 import logging
-from typing import List, Optional, Dict, Any, Tuple
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import func, and_, or_, desc
-from geoalchemy2.shape import from_shape, to_shape
-from shapely.geometry import Point, box, mapping
-import json
+from sqlalchemy import func, and_, or_, desc, cast, text, insert, table, column, BigInteger, DateTime, Float, String
+from geoalchemy2 import Geography, Geometry
+import numpy as np
+from scipy.spatial import cKDTree
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; the NumPy path is used without it
+    njit = None
+
+from app.core.cache import redis_cached
+from app.core.config import settings
 from app.models.spatial_data import WeatherData
-from app.schemas.weather import WeatherDataResponse, WeatherDataQuery, WeatherStatsResponse
+from app.schemas.weather import WeatherDataQuery, WeatherStatsResponse
 
 logger = logging.getLogger(__name__)
 
-async def get_weather_data(
-    db: AsyncSession, 
-    query: WeatherDataQuery
-) -> List[WeatherDataResponse]:
+# TimescaleDB continuous aggregate of weather_data per hour, data type and
+# location (see database/timescale.sql)
+_weather_hourly = table(
+    'weather_hourly',
+    column('bucket', DateTime),
+    column('data_type', String),
+    column('location', Geometry('POINT', srid=4326)),
+    column('value_sum', Float),
+    column('value_min', Float),
+    column('value_max', Float),
+    column('value_count', BigInteger),
+    column('unit', String)
+)
+
+# date_trunc precision for each statistics interval
+_STATS_TRUNC = {
+    'hourly': 'hour',
+    'daily': 'day',
+    'weekly': 'week',
+    'monthly': 'month'
+}
+
+# Unit per data_type; effectively constant, so looked up at most once per process
+_unit_cache: Dict[str, str] = {}
+
+# Number of nearest observations each grid cell is interpolated from
+HEATMAP_NEIGHBORS = 8
+
+# Grid generation and IDW aggregation run inside PostGIS so only the final grid
+# crosses the wire. The KNN ordering (<->) is backed by idx_weather_data_location.
+_HEATMAP_IDW_SQL = text("""
+    WITH grid AS (
+        SELECT
+            i,
+            j,
+            CAST(:min_lon AS double precision) + i * CAST(:resolution AS double precision) AS lon,
+            CAST(:min_lat AS double precision) + j * CAST(:resolution AS double precision) AS lat
+        FROM generate_series(0, CAST(:lon_steps AS integer) - 1) AS i,
+             generate_series(0, CAST(:lat_steps AS integer) - 1) AS j
+    )
+    SELECT
+        grid.lon,
+        grid.lat,
+        COALESCE(
+            (array_agg(k.value ORDER BY k.d) FILTER (WHERE k.d < 0.0001))[1],
+            SUM(k.value / NULLIF(k.d * k.d, 0)) / SUM(1.0 / NULLIF(k.d * k.d, 0))
+        ) AS value,
+        MIN(k.unit) AS unit
+    FROM grid
+    CROSS JOIN LATERAL (
+        SELECT
+            w.value,
+            w.unit,
+            w.location <-> ST_SetSRID(ST_MakePoint(grid.lon, grid.lat), 4326) AS d
+        FROM weather_data w
+        WHERE w.data_type = :data_type
+          AND w.timestamp BETWEEN :start_time AND :end_time
+          AND ST_Within(w.location, ST_MakeEnvelope(:min_lon, :min_lat, :max_lon, :max_lat, 4326))
+        ORDER BY d
+        LIMIT :neighbors
+    ) AS k
+    GROUP BY grid.i, grid.j, grid.lon, grid.lat
+    ORDER BY grid.i, grid.j
+""")
+
+def _covers_globe(bbox: List[float]) -> bool:
     """
-    Retrieve weather data based on filtering criteria
+    Whether a [min_lon, min_lat, max_lon, max_lat] bbox spans the whole world
+    """
+    min_lon, min_lat, max_lon, max_lat = bbox
+    return min_lon <= -180 and min_lat <= -90 and max_lon >= 180 and max_lat >= 90
+
+def _bbox_envelope(min_lon: float, min_lat: float, max_lon: float, max_lat: float):
+    """
+    Bounding box polygon built by PostGIS from bound coordinates
+    """
+    return func.ST_MakeEnvelope(min_lon, min_lat, max_lon, max_lat, 4326)
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _idw_kernel(d, idx, pv, out):
+        """
+        Fused IDW weighting over each cell's nearest neighbors, parallel across cells
+        """
+        for i in prange(d.shape[0]):
+            # Neighbors are sorted by distance, so column 0 is the closest
+            if d[i, 0] < 1e-4:
+                out[i] = pv[idx[i, 0]]
+                continue
+            weighted_sum = 0.0
+            total_weight = 0.0
+            for k in range(d.shape[1]):
+                w = 1.0 / (d[i, k] * d[i, k])
+                weighted_sum += w * pv[idx[i, k]]
+                total_weight += w
+            out[i] = weighted_sum / total_weight
+    
+    # Compile at import so the first heatmap request doesn't pay for the JIT
+    _idw_kernel(np.ones((1, 1)), np.zeros((1, 1), dtype=np.int64), np.ones(1), np.empty(1))
+else:
+    _idw_kernel = None
+
+def _interpolate_idw(
+    px: np.ndarray,
+    py: np.ndarray,
+    pv: np.ndarray,
+    lons: np.ndarray,
+    lats: np.ndarray,
+    neighbors: int = HEATMAP_NEIGHBORS
+) -> np.ndarray:
+    """
+    Inverse distance weighting of point values onto a regular grid
+    
+    Each cell is interpolated from its nearest observations only, found with a
+    k-d tree, so the cost is O(cells * neighbors) rather than O(cells * points).
     
     Args:
-        db: Database session
-        query: Query parameters for filtering
+        px: Longitudes of the observed points
+        py: Latitudes of the observed points
+        pv: Observed values
+        lons: Grid longitudes
+        lats: Grid latitudes
+        neighbors: Number of nearest observations used per cell
         
     Returns:
-        List of weather data points matching the criteria
+        Array of shape (len(lons), len(lats)) with interpolated values
     """
-    try:
-        # Build query
-        stmt = select(WeatherData)
-        
-        # Apply filters
-        if query.data_type:
-            stmt = stmt.where(WeatherData.data_type == query.data_type)
-        
-        if query.source:
-            stmt = stmt.where(WeatherData.source == query.source)
-        
-        if query.start_date:
-            stmt = stmt.where(WeatherData.timestamp >= query.start_date)
+    grid_lon, grid_lat = np.meshgrid(lons, lats, indexing='ij')
+    cells = np.column_stack([grid_lon.ravel(), grid_lat.ravel()])
+    
+    tree = cKDTree(np.column_stack([px, py]))
+    k = min(neighbors, len(pv))
+    d, idx = tree.query(cells, k=k)
+    if k == 1:
+        d, idx = d[:, None], idx[:, None]
+    
+    if _idw_kernel is not None:
+        out = np.empty(len(cells))
+        _idw_kernel(d, idx.astype(np.int64, copy=False), pv, out)
+        return out.reshape(grid_lon.shape)
+    
+    # Cells sitting on top of a point (distance < 0.0001) take that point's
+    # value; query() sorts by distance, so that is always column 0
+    near = d[:, 0] < 1e-4
+    d2 = np.where(near[:, None], 1.0, d * d)
+    weights = 1.0 / d2
+    values = (weights * pv[idx]).sum(axis=-1) / weights.sum(axis=-1)
+    values = np.where(near, pv[idx[:, 0]], values)
+    return values.reshape(grid_lon.shape)
+
+# Columns needed to build a weather data response. The location is split into
+# plain coordinates so neither ORM hydration nor WKB parsing is needed, and
+# 'metadata' goes through the table since the declarative MetaData shadows it
+_WEATHER_DATA_COLUMNS = (
+    WeatherData.id,
+    WeatherData.source,
+    WeatherData.timestamp,
+    WeatherData.data_type,
+    WeatherData.value,
+    WeatherData.unit,
+    WeatherData.station_id,
+    WeatherData.station_name,
+    func.ST_X(WeatherData.location).label('lon'),
+    func.ST_Y(WeatherData.location).label('lat'),
+    WeatherData.__table__.c.metadata
+)
+
+def _weather_row_to_dict(row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a weather data row into a plain dict for orjson serialization
+    
+    Args:
+        row: Row mapping selected with _WEATHER_DATA_COLUMNS
         
-        if query.end_date:
-            stmt = stmt.where(WeatherData.timestamp <= query.end_date)
+    Returns:
+        Dictionary shaped like WeatherDataResponse
+    """
+    return {
+        'id': row['id'],
+        'source': row['source'],
+        'timestamp': row['timestamp'],
+        'data_type': row['data_type'],
+        'value': row['value'],
+        'unit': row['unit'],
+        'station_id': row['station_id'],
+        'station_name': row['station_name'],
+        'location': {'type': 'Point', 'coordinates': [row['lon'], row['lat']]},
+        # JSONB comes back from asyncpg already decoded
+        'metadata': row['metadata']
+    }
+
+def _build_weather_data_stmt(query: WeatherDataQuery):
+    """
+    Build the filtered, ordered and paginated weather data select
+    
+    Args:
+        query: Query parameters for filtering
         
-        # Apply spatial filter if coordinates or bbox is provided
-        if query.lat is not None and query.lon is not None and query.radius is not None:
-            # Create a point and find data within radius (in meters)
-            point = Point(query.lon, query.lat)
-            point_wkb = from_shape(point, srid=4326)
+    Returns:
+        Select yielding the _WEATHER_DATA_COLUMNS of matching rows
+    """
+    # Build query over only the response columns
+    stmt = select(*_WEATHER_DATA_COLUMNS)
+    
+    # Apply filters
+    if query.data_type:
+        stmt = stmt.where(WeatherData.data_type == query.data_type)
+    
+    if query.source:
+        stmt = stmt.where(WeatherData.source == query.source)
+    
+    if query.start_date:
+        stmt = stmt.where(WeatherData.timestamp >= query.start_date)
+    
+    if query.end_date:
+        stmt = stmt.where(WeatherData.timestamp <= query.end_date)
+    
+    # Apply spatial filter if coordinates or bbox is provided
+    if query.lat is not None and query.lon is not None and query.radius is not None:
+        point = func.ST_SetSRID(func.ST_MakePoint(query.lon, query.lat), 4326)
+        if query.radius == 0:
+            # A zero radius is an exact location match; plain geometry
+            # intersection avoids the geography cast and its distance math
+            stmt = stmt.where(func.ST_Intersects(WeatherData.location, point))
+        else:
+            # Find data within radius (in meters). Comparing as geography
+            # keeps the filter on the idx_weather_data_location_geog index.
             stmt = stmt.where(
                 func.ST_DWithin(
-                    func.ST_Transform(WeatherData.location, 3857),
-                    func.ST_Transform(point_wkb, 3857),
+                    cast(WeatherData.location, Geography(geometry_type=None)),
+                    cast(point, Geography(geometry_type=None)),
                     query.radius
                 )
             )
-        elif query.bbox:
-            # Filter by bounding box
-            min_lon, min_lat, max_lon, max_lat = query.bbox
-            bbox_geom = box(min_lon, min_lat, max_lon, max_lat)
-            bbox_wkb = from_shape(bbox_geom, srid=4326)
-            stmt = stmt.where(func.ST_Within(WeatherData.location, bbox_wkb))
-        
-        # Apply station filter if provided
-        if query.station_id:
-            stmt = stmt.where(WeatherData.station_id == query.station_id)
-        
-        # Apply min/max value filter if provided
-        if query.min_value is not None:
-            stmt = stmt.where(WeatherData.value >= query.min_value)
-        
-        if query.max_value is not None:
-            stmt = stmt.where(WeatherData.value <= query.max_value)
-        
-        # Apply pagination
-        stmt = stmt.offset(query.offset).limit(query.limit)
-        
-        # Order by timestamp (newest first by default)
-        if query.order_by == 'oldest':
-            stmt = stmt.order_by(WeatherData.timestamp.asc())
-        else:
-            stmt = stmt.order_by(WeatherData.timestamp.desc())
+    elif query.bbox and not _covers_globe(query.bbox):
+        # Filter by bounding box; a whole-world bbox filters nothing and is skipped
+        bbox_geom = _bbox_envelope(*query.bbox)
+        stmt = stmt.where(func.ST_Within(WeatherData.location, bbox_geom))
+    
+    # Apply station filter if provided
+    if query.station_id:
+        stmt = stmt.where(WeatherData.station_id == query.station_id)
+    
+    # Apply min/max value filter if provided
+    if query.min_value is not None:
+        stmt = stmt.where(WeatherData.value >= query.min_value)
+    
+    if query.max_value is not None:
+        stmt = stmt.where(WeatherData.value <= query.max_value)
+    
+    # Apply pagination
+    stmt = stmt.offset(query.offset).limit(query.limit)
+    
+    # Order by timestamp (newest first by default)
+    if query.order_by == 'oldest':
+        stmt = stmt.order_by(WeatherData.timestamp.asc())
+    else:
+        stmt = stmt.order_by(WeatherData.timestamp.desc())
+    
+    return stmt
+
+async def get_weather_data(
+    db: AsyncSession, 
+    query: WeatherDataQuery
+) -> List[Dict[str, Any]]:
+    """
+    Retrieve weather data based on filtering criteria
+    
+    Args:
+        db: Database session
+        query: Query parameters for filtering
         
+    Returns:
+        List of weather data points matching the criteria
+    """
+    try:
         # Execute query
-        result = await db.execute(stmt)
-        weather_data_points = result.scalars().all()
-        
-        # Convert to response models
-        responses = []
-        for data_point in weather_data_points:
-            # Convert WKB geometry to GeoJSON
-            location_shape = to_shape(data_point.location)
-            location_geojson = mapping(location_shape)
-            
-            # Convert to response model
-            response = WeatherDataResponse(
-                id=data_point.id,
-                source=data_point.source,
-                timestamp=data_point.timestamp,
-                data_type=data_point.data_type,
-                value=data_point.value,
-                unit=data_point.unit,
-                station_id=data_point.station_id,
-                station_name=data_point.station_name,
-                location=location_geojson,
-                metadata=json.loads(data_point.metadata) if isinstance(data_point.metadata, str) else data_point.metadata
-            )
-            responses.append(response)
+        result = await db.execute(_build_weather_data_stmt(query))
+        rows = result.mappings().all()
+        
+        # Plain dicts skip per-row Pydantic validation; the route serializes them with orjson
+        responses = [_weather_row_to_dict(row) for row in rows]
         
         logger.info(f"Retrieved {len(responses)} weather data points")
         return responses
@@ -116,10 +310,41 @@ async def get_weather_data(
         logger.error(f"Error retrieving weather data: {e}", exc_info=True)
         raise
 
+async def stream_weather_data(
+    db: AsyncSession, 
+    query: WeatherDataQuery
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream weather data matching the filtering criteria row by row
+    
+    Rows are pulled from a server-side cursor, so memory use is bounded by the
+    driver's fetch batch rather than by query.limit.
+    
+    Args:
+        db: Database session
+        query: Query parameters for filtering
+        
+    Yields:
+        Weather data points matching the criteria
+    """
+    count = 0
+    try:
+        stmt = _build_weather_data_stmt(query).execution_options(yield_per=500)
+        result = await db.stream(stmt)
+        async for row in result.mappings():
+            count += 1
+            yield _weather_row_to_dict(row)
+        
+        logger.info(f"Streamed {count} weather data points")
+    
+    except Exception as e:
+        logger.error(f"Error streaming weather data after {count} rows: {e}", exc_info=True)
+        raise
+
 async def get_weather_data_by_id(
     db: AsyncSession, 
     data_id: int
-) -> Optional[WeatherDataResponse]:
+) -> Optional[Dict[str, Any]]:
     """
     Get a specific weather data point by ID
     
@@ -132,33 +357,17 @@ async def get_weather_data_by_id(
     """
     try:
         # Build query
-        stmt = select(WeatherData).where(WeatherData.id == data_id)
+        stmt = select(*_WEATHER_DATA_COLUMNS).where(WeatherData.id == data_id)
         
         # Execute query
         result = await db.execute(stmt)
-        data_point = result.scalars().first()
+        row = result.mappings().first()
         
-        if not data_point:
+        if not row:
             logger.warning(f"Weather data point with ID {data_id} not found")
             return None
         
-        # Convert WKB geometry to GeoJSON
-        location_shape = to_shape(data_point.location)
-        location_geojson = mapping(location_shape)
-        
-        # Convert to response model
-        response = WeatherDataResponse(
-            id=data_point.id,
-            source=data_point.source,
-            timestamp=data_point.timestamp,
-            data_type=data_point.data_type,
-            value=data_point.value,
-            unit=data_point.unit,
-            station_id=data_point.station_id,
-            station_name=data_point.station_name,
-            location=location_geojson,
-            metadata=json.loads(data_point.metadata) if isinstance(data_point.metadata, str) else data_point.metadata
-        )
+        response = _weather_row_to_dict(row)
         
         logger.info(f"Retrieved weather data point with ID {data_id}")
         return response
@@ -170,7 +379,7 @@ async def get_weather_data_by_id(
 async def create_weather_data_point(
     db: AsyncSession, 
     data: Dict[str, Any]
-) -> WeatherDataResponse:
+) -> Dict[str, Any]:
     """
     Create a new weather data point
     
@@ -182,22 +391,78 @@ async def create_weather_data_point(
         Created weather data point
     """
     try:
-        # Create new weather data point
-        weather_data_point = WeatherData(**data)
-        
-        # Add to database
-        db.add(weather_data_point)
+        # Insert and read back the response columns in a single round trip
+        stmt = insert(WeatherData).values(**data).returning(*_WEATHER_DATA_COLUMNS)
+        result = await db.execute(stmt)
+        row = result.mappings().first()
         await db.commit()
-        await db.refresh(weather_data_point)
         
-        # Get the created data point
-        return await get_weather_data_by_id(db, weather_data_point.id)
+        return _weather_row_to_dict(row)
     
     except Exception as e:
         await db.rollback()
         logger.error(f"Error creating weather data point: {e}", exc_info=True)
         raise
 
+async def bulk_create_weather_data_points(
+    db: AsyncSession, 
+    rows: List[Dict[str, Any]]
+) -> List[int]:
+    """
+    Insert many weather data points in a single executemany round trip
+    
+    Args:
+        db: Database session
+        rows: Weather data point data, keyed like WeatherData columns
+        
+    Returns:
+        IDs of the created weather data points, in input order
+    """
+    if not rows:
+        return []
+    
+    try:
+        stmt = insert(WeatherData).returning(WeatherData.id, sort_by_parameter_order=True)
+        result = await db.execute(stmt, rows)
+        ids = list(result.scalars())
+        await db.commit()
+        
+        logger.info(f"Inserted {len(ids)} weather data points")
+        return ids
+    
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"Error bulk creating weather data points: {e}", exc_info=True)
+        raise
+
+async def _get_unit(db: AsyncSession, data_type: str) -> str:
+    """
+    Get the unit of measurement for a data type, querying only on a cache miss
+    
+    Args:
+        db: Database session
+        data_type: Type of weather data
+        
+    Returns:
+        Unit string, or an empty string if no data of this type exists
+    """
+    if data_type in _unit_cache:
+        return _unit_cache[data_type]
+    
+    stmt = select(WeatherData.unit).where(
+        WeatherData.data_type == data_type
+    ).limit(1)
+    
+    result = await db.execute(stmt)
+    unit = result.scalar()
+    if not unit:
+        # Don't cache misses; the data type may be ingested later
+        return ""
+    
+    _unit_cache[data_type] = unit
+    return unit
+
+@redis_cached('weather:stats')
 async def get_weather_statistics(
     db: AsyncSession,
     data_type: str,
@@ -209,6 +474,8 @@ async def get_weather_statistics(
     """
     Get statistical aggregations of weather data
     
+    Results are cached in Redis; a cache hit returns the response as a dict.
+    
     Args:
         db: Database session
         data_type: Type of weather data (e.g., 'temperature', 'precipitation')
@@ -230,42 +497,64 @@ async def get_weather_statistics(
         
         # Create spatial filter
         min_lon, min_lat, max_lon, max_lat = bbox
-        bbox_geom = box(min_lon, min_lat, max_lon, max_lat)
-        bbox_wkb = from_shape(bbox_geom, srid=4326)
-        
-        # Define time interval for grouping
-        if interval == 'hourly':
-            time_bucket = func.date_trunc('hour', WeatherData.timestamp)
-        elif interval == 'daily':
-            time_bucket = func.date_trunc('day', WeatherData.timestamp)
-        elif interval == 'weekly':
-            time_bucket = func.date_trunc('week', WeatherData.timestamp)
-        elif interval == 'monthly':
-            time_bucket = func.date_trunc('month', WeatherData.timestamp)
+        bbox_geom = _bbox_envelope(min_lon, min_lat, max_lon, max_lat)
+        
+        # Define time interval for grouping (default to daily)
+        trunc = _STATS_TRUNC.get(interval, 'day')
+        
+        if settings.WEATHER_HOURLY_AGGREGATE:
+            # Roll up the precomputed hourly buckets instead of scanning raw
+            # rows; time bounds are therefore hour-granular
+            source = _weather_hourly.c
+            time_bucket = func.date_trunc(trunc, source.bucket)
+            measures = (
+                (func.sum(source.value_sum) / func.sum(source.value_count)).label('avg_value'),
+                func.min(source.value_min).label('min_value'),
+                func.max(source.value_max).label('max_value'),
+                cast(func.coalesce(func.sum(source.value_count), 0), BigInteger).label('count'),
+                func.max(source.unit).label('unit')
+            )
+            filters = (
+                source.data_type == data_type,
+                source.bucket.between(func.date_trunc('hour', start_date), end_date),
+                func.ST_Within(source.location, bbox_geom)
+            )
         else:
-            # Default to daily
-            time_bucket = func.date_trunc('day', WeatherData.timestamp)
+            time_bucket = func.date_trunc(trunc, WeatherData.timestamp)
+            measures = (
+                func.avg(WeatherData.value).label('avg_value'),
+                func.min(WeatherData.value).label('min_value'),
+                func.max(WeatherData.value).label('max_value'),
+                func.count(WeatherData.id).label('count'),
+                func.max(WeatherData.unit).label('unit')
+            )
+            filters = (
+                WeatherData.data_type == data_type,
+                WeatherData.timestamp.between(start_date, end_date),
+                func.ST_Within(WeatherData.location, bbox_geom)
+            )
         
-        # Build query for aggregation
+        # Build query for aggregation. GROUPING SETS computes the per-bucket
+        # rows and the overall row (bucket IS NULL, grouping() = 1) in one pass.
         stmt = select(
             time_bucket.label('timestamp'),
-            func.avg(WeatherData.value).label('avg_value'),
-            func.min(WeatherData.value).label('min_value'),
-            func.max(WeatherData.value).label('max_value'),
-            func.count(WeatherData.id).label('count')
+            func.grouping(time_bucket).label('is_overall'),
+            *measures
         ).where(
-            WeatherData.data_type == data_type,
-            WeatherData.timestamp.between(start_date, end_date),
-            func.ST_Within(WeatherData.location, bbox_wkb)
+            *filters
         ).group_by(
-            time_bucket
+            func.grouping_sets(time_bucket, text('()'))
         ).order_by(
             time_bucket
         )
         
         # Execute query
         result = await db.execute(stmt)
-        time_series = result.fetchall()
+        rows = result.fetchall()
+        
+        # Split the overall aggregate from the time series
+        overall = next(row for row in rows if row.is_overall)
+        time_series = [row for row in rows if not row.is_overall]
         
         # Build time series data
         time_series_data = [
@@ -279,30 +568,12 @@ async def get_weather_statistics(
             for ts in time_series
         ]
         
-        # Calculate overall statistics
-        stmt_overall = select(
-            func.avg(WeatherData.value).label('avg_value'),
-            func.min(WeatherData.value).label('min_value'),
-            func.max(WeatherData.value).label('max_value'),
-            func.count(WeatherData.id).label('count')
-        ).where(
-            WeatherData.data_type == data_type,
-            WeatherData.timestamp.between(start_date, end_date),
-            func.ST_Within(WeatherData.location, bbox_wkb)
-        )
-        
-        # Execute query
-        result_overall = await db.execute(stmt_overall)
-        overall = result_overall.fetchone()
-        
-        # Get a sample data point to determine unit
-        stmt_sample = select(WeatherData.unit).where(
-            WeatherData.data_type == data_type
-        ).limit(1)
-        
-        result_sample = await db.execute(stmt_sample)
-        sample = result_sample.scalar()
-        unit = sample if sample else ""
+        unit = overall.unit
+        if unit is None:
+            # Nothing matched the filters; fall back to any row of this data type
+            unit = await _get_unit(db, data_type)
+        else:
+            _unit_cache.setdefault(data_type, unit)
         
         # Build response
         response = WeatherStatsResponse(
@@ -328,6 +599,117 @@ async def get_weather_statistics(
         logger.error(f"Error generating weather statistics: {e}", exc_info=True)
         raise
 
+async def _heatmap_grid_in_database(
+    db: AsyncSession,
+    data_type: str,
+    bbox: List[float],
+    start_time: datetime,
+    end_time: datetime,
+    resolution: float,
+    lon_steps: int,
+    lat_steps: int
+) -> Tuple[List[Dict[str, Any]], str]:
+    """
+    Interpolate the heatmap grid inside PostGIS
+    
+    Each grid cell is weighted from its HEATMAP_NEIGHBORS nearest observations.
+    
+    Returns:
+        Tuple of (grid points, unit); the list is empty when no data was found
+    """
+    min_lon, min_lat, max_lon, max_lat = bbox
+    result = await db.execute(_HEATMAP_IDW_SQL, {
+        'min_lon': min_lon,
+        'min_lat': min_lat,
+        'max_lon': max_lon,
+        'max_lat': max_lat,
+        'resolution': resolution,
+        'lon_steps': lon_steps,
+        'lat_steps': lat_steps,
+        'data_type': data_type,
+        'start_time': start_time,
+        'end_time': end_time,
+        'neighbors': HEATMAP_NEIGHBORS
+    })
+    rows = result.all()
+    
+    if not rows:
+        return [], ''
+    
+    grid_points = [
+        {
+            'lon': row.lon,
+            'lat': row.lat,
+            'value': row.value
+        }
+        for row in rows
+    ]
+    return grid_points, rows[0].unit
+
+async def _heatmap_grid_in_python(
+    db: AsyncSession,
+    data_type: str,
+    bbox: List[float],
+    start_time: datetime,
+    end_time: datetime,
+    resolution: float,
+    lon_steps: int,
+    lat_steps: int
+) -> Tuple[List[Dict[str, Any]], str]:
+    """
+    Fetch the observations and interpolate the heatmap grid with NumPy
+    
+    Returns:
+        Tuple of (grid points, unit); the list is empty when no data was found
+    """
+    # Create spatial filter
+    min_lon, min_lat, max_lon, max_lat = bbox
+    bbox_geom = _bbox_envelope(min_lon, min_lat, max_lon, max_lat)
+    
+    # Get weather data points in the area and time window, with raw
+    # coordinates so no WKB parsing is needed
+    stmt = select(
+        WeatherData.value,
+        WeatherData.unit,
+        func.ST_X(WeatherData.location).label('lon'),
+        func.ST_Y(WeatherData.location).label('lat')
+    ).where(
+        WeatherData.data_type == data_type,
+        WeatherData.timestamp.between(start_time, end_time),
+        func.ST_Within(WeatherData.location, bbox_geom)
+    )
+    
+    # Execute query
+    result = await db.execute(stmt)
+    weather_points = result.all()
+    
+    if not weather_points:
+        return [], ''
+    
+    # Extract point arrays once
+    count = len(weather_points)
+    px = np.fromiter((p.lon for p in weather_points), dtype=np.float64, count=count)
+    py = np.fromiter((p.lat for p in weather_points), dtype=np.float64, count=count)
+    pv = np.fromiter((p.value for p in weather_points), dtype=np.float64, count=count)
+    
+    lons = min_lon + np.arange(lon_steps) * resolution
+    lats = min_lat + np.arange(lat_steps) * resolution
+    values = _interpolate_idw(px, py, pv, lons, lats)
+    
+    grid_points = [
+        {
+            'lon': lon,
+            'lat': lat,
+            'value': value
+        }
+        for lon, row in zip(lons.tolist(), values.tolist())
+        for lat, value in zip(lats.tolist(), row)
+    ]
+    
+    # Extract unit from first point
+    return grid_points, weather_points[0].unit
+
+@redis_cached('weather:heatmap')
 async def get_weather_heatmap_data(
     db: AsyncSession,
     data_type: str,
@@ -354,24 +736,24 @@ async def get_weather_heatmap_data(
         start_time = timestamp - timedelta(hours=time_window)
         end_time = timestamp + timedelta(hours=time_window)
         
-        # Create spatial filter
+        # Generate grid points with interpolated values
+        # This is a simplified approach - in a real system you would use proper
+        # spatial interpolation algorithms like IDW, Kriging, etc.
         min_lon, min_lat, max_lon, max_lat = bbox
-        bbox_geom = box(min_lon, min_lat, max_lon, max_lat)
-        bbox_wkb = from_shape(bbox_geom, srid=4326)
-        
-        # Get weather data points in the area and time window
-        stmt = select(WeatherData).where(
-            WeatherData.data_type == data_type,
-            WeatherData.timestamp.between(start_time, end_time),
-            func.ST_Within(WeatherData.location, bbox_wkb)
-        )
+        lon_steps = int((max_lon - min_lon) / resolution) + 1
+        lat_steps = int((max_lat - min_lat) / resolution) + 1
         
-        # Execute query
-        result = await db.execute(stmt)
-        weather_points = result.scalars().all()
+        if settings.HEATMAP_INTERPOLATION == 'python':
+            interpolate = _heatmap_grid_in_python
+        else:
+            interpolate = _heatmap_grid_in_database
+        
+        grid_points, unit = await interpolate(
+            db, data_type, bbox, start_time, end_time, resolution, lon_steps, lat_steps
+        )
         
         # If no data found, return empty grid
-        if not weather_points:
+        if not grid_points:
             logger.warning(f"No weather data found for {data_type} at {timestamp}")
             return {
                 'data_type': data_type,
@@ -382,57 +764,6 @@ async def get_weather_heatmap_data(
                 'grid_points': []
             }
         
-        # Extract unit from first point
-        unit = weather_points[0].unit
-        
-        # Create a grid of points
-        grid_points = []
-        
-        # Generate grid points with interpolated values
-        # This is a simplified approach - in a real system you would use proper
-        # spatial interpolation algorithms like IDW, Kriging, etc.
-        
-        lon_steps = int((max_lon - min_lon) / resolution) + 1
-        lat_steps = int((max_lat - min_lat) / resolution) + 1
-        
-        for i in range(lon_steps):
-            for j in range(lat_steps):
-                lon = min_lon + i * resolution
-                lat = min_lat + j * resolution
-                
-                # Simple inverse distance weighting for demonstration
-                total_weight = 0.0
-                weighted_sum = 0.0
-                
-                for point in weather_points:
-                    # Get point coordinates
-                    point_shape = to_shape(point.location)
-                    point_lon, point_lat = point_shape.x, point_shape.y
-                    
-                    # Calculate distance
-                    distance = ((lon - point_lon) ** 2 + (lat - point_lat) ** 2) ** 0.5
-                    
-                    # Avoid division by zero
-                    if distance < 0.0001:
-                        # If very close, just use the point's value
-                        weighted_sum = point.value
-                        total_weight = 1.0
-                        break
-                    
-                    # Inverse distance weight
-                    weight = 1.0 / (distance ** 2)
-                    weighted_sum += weight * point.value
-                    total_weight += weight
-                
-                if total_weight > 0:
-                    interpolated_value = weighted_sum / total_weight
-                    
-                    grid_points.append({
-                        'lon': lon,
-                        'lat': lat,
-                        'value': float(interpolated_value)
-                    })
-        
         # Build response
         response = {
             'data_type': data_type,
@@ -1,9 +1,12 @@
 from fastapi import FastAPI, Depends, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 import uvicorn
 from typing import List, Optional
 import logging
+import os
+
+from app.core.config import settings
 
 # Setup logging
 logging.basicConfig(
@@ -16,17 +19,25 @@ app = FastAPI(
     title="VisionEarth API",
     description="Backend API for VisionEarth platform providing real-time environmental data",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS Middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, set to specific origins
+    allow_origins=settings.BACKEND_CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=settings.CORS_MAX_AGE,
 )
 
+@app.on_event("startup")
+async def warm_up_db_pool():
+    from app.db.base import warm_up_pool
+    opened = await warm_up_pool()
+    logger.info(f"Database connection pool warmed up with {opened} connections")
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
@@ -51,4 +62,14 @@ async def generic_exception_handler(request, exc):
     )
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    if os.getenv("DEV"):
+        uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    else:
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=8000,
+            workers=settings.WEB_CONCURRENCY,
+            loop="uvloop",
+            http="httptools",
+        )
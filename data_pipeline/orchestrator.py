@@ -1,26 +1,147 @@
 import os
 import logging
 import datetime
-from typing import Dict, List, Optional, Any, Union
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Optional, Any, Union
 import json
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import geopandas as gpd
+import shapely
 from pathlib import Path
 import tempfile
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import csv
+import io
+import itertools
 import sqlalchemy
+from psycopg2.extras import execute_values
 from sqlalchemy.orm import Session
 from dotenv import load_dotenv
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+import hashlib
+import functools
+import diskcache
+import threading
+import asyncio
 import time
 
 # Import providers
 from providers.sentinel_hub import SentinelHubConnector
 from providers.noaa_weather import NOAAWeatherConnector
 
+# Load environment variables once per process
+load_dotenv()
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Provider response cache. Bump the version when a connector's output format
+# changes so stale entries are ignored.
+CACHE_VERSION = 1
+CACHE_TTL_SENTINEL_SEARCH = 6 * 60 * 60  # New acquisitions keep appearing
+CACHE_TTL_NOAA_STATIONS = 24 * 60 * 60
+CACHE_TTL_NOAA_DATA = 7 * 24 * 60 * 60  # Historical observations rarely change
+
+# Stations per NOAA data request (sent as repeated stationid parameters)
+NOAA_STATIONS_PER_REQUEST = 25
+
+# Default cap on NOAA requests in flight across all regions in the async pipeline
+NOAA_ASYNC_MAX_CONCURRENCY = 16
+
+# Columns of NOAA CDO data plus the station metadata the pipeline attaches.
+# Fixed so that every batch appended to a Parquet file has the same schema.
+WEATHER_PARQUET_SCHEMA = pa.schema([
+    ('date', pa.string()),
+    ('datatype', pa.string()),
+    ('station', pa.string()),
+    ('attributes', pa.string()),
+    ('value', pa.float64()),
+    ('station_name', pa.string()),
+    ('latitude', pa.float64()),
+    ('longitude', pa.float64()),
+    ('elevation', pa.float64())
+])
+
+# Returned when no weather data is found; callers only check .empty, so it must never be mutated
+_EMPTY_DF = pd.DataFrame()
+
+def _json_default(obj: Any) -> Any:
+    """
+    orjson fallback for values it can't serialize natively (e.g. pandas Timestamps)
+    """
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    return str(obj)
+
+def _dumps_metadata(obj: Any) -> str:
+    """
+    Serialize a metadata record to JSON text with orjson
+    
+    Args:
+        obj: Record to serialize
+        
+    Returns:
+        JSON string (NaN and numpy scalars are handled natively)
+    """
+    return orjson.dumps(
+        obj,
+        default=_json_default,
+        option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+    ).decode()
+
+class _CsvRowStream(io.TextIOBase):
+    """
+    Read-only text stream that renders rows as CSV on demand, so COPY can
+    consume a generator without the whole payload being built in memory
+    """
+    
+    def __init__(self, rows: Iterable[Iterable[Any]]):
+        self._rows = iter(rows)
+        self._line = io.StringIO()
+        self._writer = csv.writer(self._line)
+        self._pending = ''
+    
+    def readable(self) -> bool:
+        return True
+    
+    def read(self, size: Optional[int] = -1) -> str:
+        if size is None:
+            size = -1
+        
+        chunks = [self._pending]
+        length = len(self._pending)
+        
+        while size < 0 or length < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            
+            self._line.seek(0)
+            self._line.truncate()
+            self._writer.writerow(row)
+            line = self._line.getvalue()
+            chunks.append(line)
+            length += len(line)
+        
+        data = ''.join(chunks)
+        if size < 0:
+            self._pending = ''
+            return data
+        
+        self._pending = data[size:]
+        return data[:size]
+
+def _frame_column(frame: pd.DataFrame, name: str, default: Any = None) -> Iterable[Any]:
+    """
+    Iterate over a DataFrame column, or repeat a default if it is missing
+    """
+    return frame[name] if name in frame else itertools.repeat(default, len(frame))
+
 class DataPipelineOrchestrator:
     """
     Orchestrates the data ingestion pipeline from various data sources
@@ -30,7 +151,9 @@ class DataPipelineOrchestrator:
     def __init__(
         self,
         db_connection_string: Optional[str] = None,
-        data_dir: Optional[str] = None
+        data_dir: Optional[str] = None,
+        max_parallel_regions: int = 8,
+        max_concurrent_provider_requests: int = 4
     ):
         """
         Initialize the data pipeline orchestrator
@@ -38,16 +161,22 @@ class DataPipelineOrchestrator:
         Args:
             db_connection_string: Database connection string
             data_dir: Directory for temporary data storage
+            max_parallel_regions: Number of regions processed concurrently
+            max_concurrent_provider_requests: Cap on in-flight calls per data
+                provider, to stay under Sentinel Hub / NOAA rate limits
         """
-        # Load environment variables
-        load_dotenv()
-        
         # Set up database connection
         self.db_connection_string = db_connection_string or os.getenv('DATABASE_URL')
         self.engine = None
         if self.db_connection_string:
             try:
-                self.engine = sqlalchemy.create_engine(self.db_connection_string)
+                # Each region thread may store satellite and weather data at once
+                self.engine = sqlalchemy.create_engine(
+                    self.db_connection_string,
+                    pool_size=max_parallel_regions,
+                    max_overflow=max_parallel_regions,
+                    pool_pre_ping=True
+                )
                 logger.info(f"Connected to database")
             except Exception as e:
                 logger.error(f"Error connecting to database: {str(e)}")
@@ -56,14 +185,103 @@ class DataPipelineOrchestrator:
         self.data_dir = data_dir
         if not self.data_dir:
             self.data_dir = os.path.join(os.getcwd(), 'data')
-        os.makedirs(self.data_dir, exist_ok=True)
         
-        # Initialize data providers
-        self.sentinel_hub = SentinelHubConnector()
-        self.noaa_weather = NOAAWeatherConnector()
+        # Created once here rather than on every fetch (makedirs also creates data_dir)
+        self.satellite_dir = os.path.join(self.data_dir, 'satellite')
+        os.makedirs(self.satellite_dir, exist_ok=True)
+        
+        # On-disk cache of provider responses; safe to share across threads
+        self._cache = diskcache.Cache(os.path.join(self.data_dir, '_cache'))
+        
+        # Concurrency limits
+        self.max_parallel_regions = max_parallel_regions
+        self.max_concurrent_provider_requests = max_concurrent_provider_requests
+        self._sentinel_limit = threading.BoundedSemaphore(max_concurrent_provider_requests)
+        self._noaa_limit = threading.BoundedSemaphore(max_concurrent_provider_requests)
+        
+        # One HTTP connection pool for all providers, with retries on rate
+        # limiting and transient server errors
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=max(32, max_concurrent_provider_requests * 2),
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True
+            )
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        
+        # Product downloads started by this orchestrator, so regions whose
+        # searches return the same product share one download
+        self._product_downloads: Dict[str, Future] = {}
+        self._product_downloads_lock = threading.Lock()
         
         logger.info(f"Initialized data pipeline orchestrator with data directory: {self.data_dir}")
     
+    @functools.cached_property
+    def sentinel_hub(self) -> SentinelHubConnector:
+        """
+        Sentinel Hub connector, created on first use
+        """
+        return SentinelHubConnector(session=self._session)
+    
+    @functools.cached_property
+    def noaa_weather(self) -> NOAAWeatherConnector:
+        """
+        NOAA weather connector, created on first use
+        """
+        return NOAAWeatherConnector(session=self._session)
+    
+    def close(self) -> None:
+        """
+        Release HTTP connections, database connections and the response cache
+        """
+        self._session.close()
+        if 'sentinel_hub' in self.__dict__:
+            self.sentinel_hub.close()
+            if getattr(self.sentinel_hub, 'api', None) is not None:
+                self.sentinel_hub.api.session.close()
+        if self.engine is not None:
+            self.engine.dispose()
+        self._cache.close()
+    
+    def __enter__(self) -> 'DataPipelineOrchestrator':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def _cached_call(self, namespace: str, ttl: int, func, **kwargs) -> Any:
+        """
+        Call a provider method, reusing a cached response for identical arguments
+        
+        Empty responses are not cached, since providers also return them on errors.
+        
+        Args:
+            namespace: Name identifying the provider call
+            ttl: Time to live of the cached response, in seconds
+            func: Provider method to call
+            **kwargs: Arguments for the provider method
+            
+        Returns:
+            Provider response
+        """
+        key_source = json.dumps([CACHE_VERSION, namespace, kwargs], default=str, sort_keys=True)
+        key = hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()
+        
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        
+        response = func(**kwargs)
+        if len(response):
+            self._cache.set(key, response, expire=ttl)
+        return response
+    
     def fetch_satellite_data(
         self,
         bbox: List[float],  # [min_lon, min_lat, max_lon, max_lat]
@@ -90,13 +308,17 @@ class DataPipelineOrchestrator:
         logger.info(f"Fetching satellite data for bbox {bbox} from {start_date} to {end_date}")
         
         # Search for products
-        products = self.sentinel_hub.search_products(
-            bbox=bbox,
-            start_date=start_date,
-            end_date=end_date,
-            cloud_cover=(0, cloud_cover_max),
-            max_results=max_results
-        )
+        with self._sentinel_limit:
+            products = self._cached_call(
+                'sentinel.search_products',
+                CACHE_TTL_SENTINEL_SEARCH,
+                self.sentinel_hub.search_products,
+                bbox=bbox,
+                start_date=start_date,
+                end_date=end_date,
+                cloud_cover=(0, cloud_cover_max),
+                max_results=max_results
+            )
         
         result = {
             'products': products,
@@ -106,37 +328,175 @@ class DataPipelineOrchestrator:
         
         # Download products if requested
         if download and products:
-            download_dir = os.path.join(self.data_dir, 'satellite')
-            os.makedirs(download_dir, exist_ok=True)
+            # Download products concurrently; one failure doesn't cancel the rest
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = {executor.submit(self._download_product_once, product_id): product_id for product_id in products}
+                
+                for future in as_completed(futures):
+                    product_id = futures[future]
+                    try:
+                        result['downloads'][product_id] = future.result()
+                    except Exception as e:
+                        logger.error(f"Error downloading product {product_id}: {str(e)}")
+                        result['downloads'][product_id] = {'error': str(e)}
+        
+        return result
+    
+    def _download_product(self, product_id: str) -> Dict[str, Any]:
+        """
+        Download a product and its quicklook preview
+        
+        Args:
+            product_id: ID of the product to download
             
-            # Download each product
-            for product_id in products:
-                try:
-                    # Download quicklook preview
-                    quicklook_path = self.sentinel_hub.get_quicklook(
-                        product_id,
-                        output_path=os.path.join(download_dir, f"{product_id}_quicklook.jpg")
+        Returns:
+            Dictionary with the quicklook and product paths
+        """
+        # Download quicklook preview
+        with self._sentinel_limit:
+            quicklook_path = self.sentinel_hub.get_quicklook(
+                product_id,
+                output_path=os.path.join(self.satellite_dir, f"{product_id}_quicklook.jpg")
+            )
+        
+        downloads = {
+            'quicklook': quicklook_path
+        }
+        
+        # Download actual product
+        with self._sentinel_limit:
+            product_path = self.sentinel_hub.download_product(
+                product_id,
+                output_dir=os.path.join(self.satellite_dir, product_id)
+            )
+        
+        if product_path:
+            downloads['product'] = product_path
+        
+        return downloads
+    
+    def _download_product_once(self, product_id: str) -> Dict[str, Any]:
+        """
+        Download a product unless it is already being (or has been) downloaded
+        by this orchestrator, in which case wait for and reuse that result
+        
+        Args:
+            product_id: ID of the product to download
+            
+        Returns:
+            Dictionary with the quicklook and product paths
+        """
+        with self._product_downloads_lock:
+            future = self._product_downloads.get(product_id)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._product_downloads[product_id] = future
+        
+        if not is_owner:
+            logger.info(f"Product {product_id} already requested by another region, reusing its download")
+            return future.result()
+        
+        try:
+            downloads = self._download_product(product_id)
+        except Exception as e:
+            # Let a later request retry the download
+            with self._product_downloads_lock:
+                del self._product_downloads[product_id]
+            future.set_exception(e)
+            raise
+        
+        future.set_result(downloads)
+        return downloads
+    
+    def _get_weather_stations(
+        self,
+        bbox: List[float],  # [min_lat, min_lon, max_lat, max_lon]
+        dataset_id: str
+    ) -> pd.DataFrame:
+        """
+        Get the NOAA stations in a bbox as a frame of station metadata
+        
+        Args:
+            bbox: Bounding box [min_lat, min_lon, max_lat, max_lon]
+            dataset_id: Dataset identifier
+            
+        Returns:
+            DataFrame indexed by station id with station_name, latitude,
+            longitude and elevation columns (empty if no stations were found)
+        """
+        with self._noaa_limit:
+            stations = self._cached_call(
+                'noaa.get_available_stations',
+                CACHE_TTL_NOAA_STATIONS,
+                self.noaa_weather.get_available_stations,
+                dataset_id=dataset_id,
+                extent=bbox,
+                limit=50
+            )
+        
+        return (
+            pd.DataFrame(stations)
+            .reindex(columns=['id', 'name', 'latitude', 'longitude', 'elevation'])
+            .rename(columns={'name': 'station_name'})
+            .set_index('id')
+        )
+    
+    def _iter_weather_batches(
+        self,
+        station_ids: List[str],
+        start_date: Union[str, datetime.datetime],
+        end_date: Union[str, datetime.datetime],
+        dataset_id: str,
+        data_types: List[str]
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Fetch NOAA data for the given stations, requesting every data type for
+        a group of stations at once and yielding each group as it arrives
+        
+        Args:
+            station_ids: Station identifiers
+            start_date: Start date for the data retrieval
+            end_date: End date for the data retrieval
+            dataset_id: Dataset identifier
+            data_types: List of data type identifiers
+            
+        Yields:
+            Non-empty DataFrames of weather data, without station metadata
+        """
+        def fetch_station_group(group: List[str]) -> Optional[pd.DataFrame]:
+            try:
+                with self._noaa_limit:
+                    data = self._cached_call(
+                        'noaa.get_data_bulk',
+                        CACHE_TTL_NOAA_DATA,
+                        self.noaa_weather.get_data_bulk,
+                        dataset_id=dataset_id,
+                        start_date=start_date,
+                        end_date=end_date,
+                        station_ids=group,
+                        data_type_ids=data_types
                     )
-                    
-                    result['downloads'][product_id] = {
-                        'quicklook': quicklook_path
-                    }
-                    
-                    # Download actual product if requested
-                    if download:
-                        product_path = self.sentinel_hub.download_product(
-                            product_id,
-                            output_dir=os.path.join(download_dir, product_id)
-                        )
-                        
-                        if product_path:
-                            result['downloads'][product_id]['product'] = product_path
                 
-                except Exception as e:
-                    logger.error(f"Error downloading product {product_id}: {str(e)}")
-                    result['downloads'][product_id] = {'error': str(e)}
+                return None if data.empty else data
+            
+            except Exception as e:
+                logger.error(f"Error fetching data for stations {group}: {str(e)}")
+                return None
         
-        return result
+        # One paginated query per group of stations instead of one request per
+        # (station, data type) pair; groups keep the query string short
+        groups = [
+            station_ids[i:i + NOAA_STATIONS_PER_REQUEST]
+            for i in range(0, len(station_ids), NOAA_STATIONS_PER_REQUEST)
+        ]
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(fetch_station_group, group) for group in groups]
+            for future in as_completed(futures):
+                data = future.result()
+                if data is not None:
+                    yield data
     
     def fetch_weather_data(
         self,
@@ -162,53 +522,207 @@ class DataPipelineOrchestrator:
         logger.info(f"Fetching weather data for bbox {bbox} from {start_date} to {end_date}")
         
         # Get weather stations in the area
-        stations = self.noaa_weather.get_available_stations(
-            dataset_id=dataset_id,
-            extent=bbox,
-            limit=50
-        )
+        stations = self._get_weather_stations(bbox, dataset_id)
         
-        if not stations:
+        if stations.empty:
             logger.warning(f"No weather stations found in the specified bbox")
-            return pd.DataFrame()
+            return _EMPTY_DF
         
-        # Collect data from each station
-        all_data = []
+        all_data = list(self._iter_weather_batches(stations.index.tolist(), start_date, end_date, dataset_id, data_types))
         
-        for station in stations:
-            station_id = station['id']
+        # Combine all data, then attach station metadata with a single join
+        if all_data:
+            combined_data = pd.concat(all_data, ignore_index=True, copy=False)
+            combined_data = combined_data.merge(stations, left_on='station', right_index=True, how='left')
+            logger.info(f"Retrieved {len(combined_data)} weather data points from {combined_data['station'].nunique()} stations")
+            return combined_data
+        else:
+            logger.warning(f"No weather data retrieved")
+            return _EMPTY_DF
+    
+    def fetch_weather_data_to_parquet(
+        self,
+        bbox: List[float],  # [min_lat, min_lon, max_lat, max_lon]
+        start_date: Union[str, datetime.datetime],
+        end_date: Union[str, datetime.datetime],
+        output_path: str,
+        dataset_id: str = 'GHCND',
+        data_types: List[str] = ['TMAX', 'TMIN', 'PRCP']
+    ) -> int:
+        """
+        Fetch weather data from NOAA, appending each batch to a Parquet file as
+        it arrives instead of holding the whole result in memory
+        
+        Args:
+            bbox: Bounding box [min_lat, min_lon, max_lat, max_lon]
+            start_date: Start date for the data retrieval
+            end_date: End date for the data retrieval
+            output_path: Path of the Parquet file to write
+            dataset_id: Dataset identifier
+            data_types: List of data type identifiers
             
-            for data_type in data_types:
-                try:
-                    data = self.noaa_weather.get_data(
-                        dataset_id=dataset_id,
-                        start_date=start_date,
-                        end_date=end_date,
-                        station_id=station_id,
-                        data_type_id=data_type,
-                        limit=1000
-                    )
-                    
-                    if not data.empty:
-                        # Add station metadata
-                        data['station_name'] = station['name']
-                        data['latitude'] = station['latitude']
-                        data['longitude'] = station['longitude']
-                        data['elevation'] = station.get('elevation', None)
-                        
-                        all_data.append(data)
-                
-                except Exception as e:
-                    logger.error(f"Error fetching data for station {station_id}, data type {data_type}: {str(e)}")
+        Returns:
+            Number of rows written
+        """
+        logger.info(f"Streaming weather data for bbox {bbox} from {start_date} to {end_date} to {output_path}")
+        
+        stations = self._get_weather_stations(bbox, dataset_id)
+        
+        rows = 0
+        with pq.ParquetWriter(output_path, WEATHER_PARQUET_SCHEMA) as writer:
+            for data in self._iter_weather_batches(stations.index.tolist(), start_date, end_date, dataset_id, data_types):
+                table = self._weather_parquet_table(data, stations)
+                writer.write_table(table)
+                rows += table.num_rows
+        
+        logger.info(f"Wrote {rows} weather data points to {output_path}")
+        return rows
+    
+    def _weather_parquet_table(self, data: pd.DataFrame, stations: pd.DataFrame) -> pa.Table:
+        """
+        Attach station metadata to a batch of weather data and convert it to
+        an Arrow table with the weather Parquet schema
+        """
+        data = data.merge(stations, left_on='station', right_index=True, how='left')
+        return pa.Table.from_pandas(
+            data.reindex(columns=WEATHER_PARQUET_SCHEMA.names),
+            schema=WEATHER_PARQUET_SCHEMA,
+            preserve_index=False
+        )
+    
+    async def _iter_weather_batches_async(
+        self,
+        station_ids: List[str],
+        start_date: Union[str, datetime.datetime],
+        end_date: Union[str, datetime.datetime],
+        dataset_id: str,
+        data_types: List[str],
+        semaphore: Optional[asyncio.Semaphore] = None,
+        max_concurrency: int = NOAA_ASYNC_MAX_CONCURRENCY
+    ) -> AsyncIterator[pd.DataFrame]:
+        """
+        Fetch NOAA data for the given stations on the event loop, yielding
+        each station's data as soon as it arrives
+        
+        Args:
+            station_ids: Station identifiers
+            start_date: Start date for the data retrieval
+            end_date: End date for the data retrieval
+            dataset_id: Dataset identifier
+            data_types: List of data type identifiers
+            semaphore: Cap on NOAA requests in flight, shared between regions
+            max_concurrency: Connection limit of the HTTP client
+            
+        Yields:
+            Non-empty DataFrames of weather data, without station metadata
+        """
+        async for station_id, data in self.noaa_weather.iter_data_many_async(
+            dataset_id,
+            start_date,
+            end_date,
+            station_ids,
+            data_type_ids=data_types,
+            max_concurrency=max_concurrency,
+            semaphore=semaphore
+        ):
+            if not data.empty:
+                yield data
+    
+    async def fetch_weather_data_async(
+        self,
+        bbox: List[float],  # [min_lat, min_lon, max_lat, max_lon]
+        start_date: Union[str, datetime.datetime],
+        end_date: Union[str, datetime.datetime],
+        dataset_id: str = 'GHCND',
+        data_types: List[str] = ['TMAX', 'TMIN', 'PRCP'],
+        semaphore: Optional[asyncio.Semaphore] = None,
+        max_concurrency: int = NOAA_ASYNC_MAX_CONCURRENCY
+    ) -> pd.DataFrame:
+        """
+        Fetch weather data from NOAA with concurrent async requests
+        
+        Args:
+            bbox: Bounding box [min_lat, min_lon, max_lat, max_lon]
+            start_date: Start date for the data retrieval
+            end_date: End date for the data retrieval
+            dataset_id: Dataset identifier
+            data_types: List of data type identifiers
+            semaphore: Cap on NOAA requests in flight, shared between regions
+            max_concurrency: Connection limit of the HTTP client
+            
+        Returns:
+            DataFrame containing the weather data
+        """
+        logger.info(f"Fetching weather data for bbox {bbox} from {start_date} to {end_date}")
+        
+        loop = asyncio.get_running_loop()
+        stations = await loop.run_in_executor(None, self._get_weather_stations, bbox, dataset_id)
+        
+        if stations.empty:
+            logger.warning(f"No weather stations found in the specified bbox")
+            return _EMPTY_DF
+        
+        all_data = [
+            data async for data in self._iter_weather_batches_async(
+                stations.index.tolist(), start_date, end_date, dataset_id, data_types,
+                semaphore=semaphore, max_concurrency=max_concurrency
+            )
+        ]
         
-        # Combine all data
         if all_data:
-            combined_data = pd.concat(all_data, ignore_index=True)
-            logger.info(f"Retrieved {len(combined_data)} weather data points from {len(stations)} stations")
+            combined_data = pd.concat(all_data, ignore_index=True, copy=False)
+            combined_data = combined_data.merge(stations, left_on='station', right_index=True, how='left')
+            logger.info(f"Retrieved {len(combined_data)} weather data points from {combined_data['station'].nunique()} stations")
             return combined_data
         else:
             logger.warning(f"No weather data retrieved")
-            return pd.DataFrame()
+            return _EMPTY_DF
+    
+    async def fetch_weather_data_to_parquet_async(
+        self,
+        bbox: List[float],  # [min_lat, min_lon, max_lat, max_lon]
+        start_date: Union[str, datetime.datetime],
+        end_date: Union[str, datetime.datetime],
+        output_path: str,
+        dataset_id: str = 'GHCND',
+        data_types: List[str] = ['TMAX', 'TMIN', 'PRCP'],
+        semaphore: Optional[asyncio.Semaphore] = None,
+        max_concurrency: int = NOAA_ASYNC_MAX_CONCURRENCY
+    ) -> int:
+        """
+        Fetch weather data from NOAA with concurrent async requests, appending
+        each station's data to a Parquet file as soon as it arrives
+        
+        Args:
+            bbox: Bounding box [min_lat, min_lon, max_lat, max_lon]
+            start_date: Start date for the data retrieval
+            end_date: End date for the data retrieval
+            output_path: Path of the Parquet file to write
+            dataset_id: Dataset identifier
+            data_types: List of data type identifiers
+            semaphore: Cap on NOAA requests in flight, shared between regions
+            max_concurrency: Connection limit of the HTTP client
+            
+        Returns:
+            Number of rows written
+        """
+        logger.info(f"Streaming weather data for bbox {bbox} from {start_date} to {end_date} to {output_path}")
+        
+        loop = asyncio.get_running_loop()
+        stations = await loop.run_in_executor(None, self._get_weather_stations, bbox, dataset_id)
+        
+        rows = 0
+        with pq.ParquetWriter(output_path, WEATHER_PARQUET_SCHEMA) as writer:
+            async for data in self._iter_weather_batches_async(
+                stations.index.tolist(), start_date, end_date, dataset_id, data_types,
+                semaphore=semaphore, max_concurrency=max_concurrency
+            ):
+                table = self._weather_parquet_table(data, stations)
+                writer.write_table(table)
+                rows += table.num_rows
+        
+        logger.info(f"Wrote {rows} weather data points to {output_path}")
+        return rows
     
     def store_satellite_metadata(self, products: Dict[str, Any]) -> int:
         """
@@ -225,44 +739,73 @@ class DataPipelineOrchestrator:
             return 0
         
         try:
-            # Convert product metadata to DataFrame
-            records = []
+            if not products:
+                logger.warning("No records to insert")
+                return 0
             
-            for product_id, product in products.items():
-                # Extract footprint geometry
-                footprint = None
-                if 'footprint' in product and product['footprint']:
-                    try:
-                        # Parse WKT format to geometry
-                        footprint = product['footprint']
-                    except Exception as e:
-                        logger.error(f"Error parsing footprint: {str(e)}")
+            if self.engine.dialect.name == 'postgresql':
+                # Parse every footprint in one vectorized call and send hex EWKB,
+                # which PostGIS decodes far faster than parsing WKT per row
+                geoms = shapely.from_wkt(
+                    [product.get('footprint') or None for product in products.values()],
+                    on_invalid='warn'
+                )
+                footprints = shapely.to_wkb(shapely.set_srid(geoms, 4326), hex=True, include_srid=True)
                 
-                record = {
-                    'id': product_id,
-                    'source': 'sentinel-2',
-                    'acquisition_date': product.get('beginposition'),
-                    'cloud_cover_percentage': product.get('cloudcoverpercentage'),
-                    'path': product.get('filename', ''),
-                    'footprint': footprint,
-                    'metadata': json.dumps(product)
-                }
+                # Insert pre-built tuples directly; ON CONFLICT skips products
+                # already stored by an earlier or overlapping run
+                rows = [
+                    (
+                        product_id,
+                        'sentinel-2',
+                        product.get('beginposition'),
+                        product.get('cloudcoverpercentage'),
+                        product.get('filename', ''),
+                        footprint,
+                        _dumps_metadata(product)
+                    )
+                    for (product_id, product), footprint in zip(products.items(), footprints)
+                ]
                 
-                records.append(record)
-            
-            if not records:
-                logger.warning("No records to insert")
-                return 0
+                raw_conn = self.engine.raw_connection()
+                try:
+                    with raw_conn.cursor() as cur:
+                        inserted_ids = execute_values(
+                            cur,
+                            "INSERT INTO satellite_images "
+                            "(id, source, acquisition_date, cloud_cover_percentage, path, footprint, metadata) "
+                            "VALUES %s ON CONFLICT (id) DO NOTHING RETURNING id",
+                            rows,
+                            template="(%s, %s, %s, %s, %s, %s::geometry, %s)",
+                            page_size=1000,
+                            fetch=True
+                        )
+                    raw_conn.commit()
+                finally:
+                    raw_conn.close()
+                
+                inserted = len(inserted_ids)
+                logger.info(f"Inserted {inserted} satellite image metadata records ({len(rows) - inserted} already stored)")
+                return inserted
             
-            # Insert into database
-            df = pd.DataFrame(records)
+            # Other databases: go through pandas, building the frame column-wise
+            values = list(products.values())
+            df = pd.DataFrame({
+                'id': list(products.keys()),
+                'source': 'sentinel-2',
+                'acquisition_date': [product.get('beginposition') for product in values],
+                'cloud_cover_percentage': [product.get('cloudcoverpercentage') for product in values],
+                'path': [product.get('filename', '') for product in values],
+                'footprint': [product.get('footprint') or None for product in values],
+                'metadata': [_dumps_metadata(product) for product in values]
+            })
             
-            with self.engine.connect() as conn:
+            with self.engine.begin() as conn:
                 # This is a simplified approach, in a production system you would use ORM models
-                df.to_sql('satellite_images', conn, if_exists='append', index=False)
+                df.to_sql('satellite_images', conn, if_exists='append', index=False, method='multi', chunksize=1000)
             
-            logger.info(f"Inserted {len(records)} satellite image metadata records")
-            return len(records)
+            logger.info(f"Inserted {len(df)} satellite image metadata records")
+            return len(df)
         
         except Exception as e:
             logger.error(f"Error storing satellite metadata: {str(e)}")
@@ -283,46 +826,187 @@ class DataPipelineOrchestrator:
             return 0
         
         try:
-            # Prepare records for insertion
-            records = []
-            
-            for _, row in weather_data.iterrows():
-                record = {
-                    'source': 'noaa',
-                    'timestamp': row.get('date'),
-                    'data_type': row.get('datatype'),
-                    'value': row.get('value'),
-                    'unit': row.get('units', ''),
-                    'station_id': row.get('station'),
-                    'station_name': row.get('station_name', ''),
-                    'latitude': row.get('latitude'),
-                    'longitude': row.get('longitude'),
-                    'metadata': json.dumps({
-                        'elevation': row.get('elevation'),
-                        'attributes': row.get('attributes', {})
-                    })
-                }
-                
-                records.append(record)
+            columns = (
+                'source', 'timestamp', 'data_type', 'value', 'unit', 'station_id',
+                'station_name', 'latitude', 'longitude', 'metadata'
+            )
             
-            if not records:
-                logger.warning("No weather records to insert")
-                return 0
+            # Generate insert rows lazily, column by column, without an
+            # intermediate DataFrame
+            metadata = (
+                _dumps_metadata({'elevation': elevation, 'attributes': attrs})
+                for elevation, attrs in zip(
+                    _frame_column(weather_data, 'elevation'),
+                    _frame_column(weather_data, 'attributes', {})
+                )
+            )
+            rows = zip(
+                itertools.repeat('noaa'),
+                _frame_column(weather_data, 'date'),
+                _frame_column(weather_data, 'datatype'),
+                _frame_column(weather_data, 'value'),
+                _frame_column(weather_data, 'units', ''),
+                _frame_column(weather_data, 'station'),
+                _frame_column(weather_data, 'station_name', ''),
+                _frame_column(weather_data, 'latitude'),
+                _frame_column(weather_data, 'longitude'),
+                metadata
+            )
             
             # Insert into database
-            df = pd.DataFrame(records)
-            
-            with self.engine.connect() as conn:
-                # This is a simplified approach, in a production system you would use ORM models
-                df.to_sql('weather_data', conn, if_exists='append', index=False)
+            if self.engine.dialect.name == 'postgresql':
+                # Stream the rows straight into COPY
+                column_list = ', '.join(f'"{c}"' for c in columns)
+                raw_conn = self.engine.raw_connection()
+                try:
+                    with raw_conn.cursor() as cur:
+                        cur.copy_expert(
+                            f'COPY weather_data ({column_list}) FROM STDIN WITH CSV',
+                            _CsvRowStream(rows)
+                        )
+                    raw_conn.commit()
+                finally:
+                    raw_conn.close()
+            else:
+                df = pd.DataFrame.from_records(rows, columns=columns)
+                with self.engine.begin() as conn:
+                    df.to_sql('weather_data', conn, if_exists='append', index=False, method='multi', chunksize=1000)
             
-            logger.info(f"Inserted {len(records)} weather data records")
-            return len(records)
+            logger.info(f"Inserted {len(weather_data)} weather data records")
+            return len(weather_data)
         
         except Exception as e:
             logger.error(f"Error storing weather data: {str(e)}")
             return 0
     
+    def store_weather_parquet(self, parquet_path: str, batch_size: int = 10000) -> int:
+        """
+        Store weather data from a Parquet file in the database, batch by batch
+        
+        Args:
+            parquet_path: Path of a file written by fetch_weather_data_to_parquet
+            batch_size: Number of rows loaded into memory at a time
+            
+        Returns:
+            Number of records inserted
+        """
+        inserted = 0
+        for batch in pq.ParquetFile(parquet_path).iter_batches(batch_size=batch_size):
+            inserted += self.store_weather_data(batch.to_pandas())
+        return inserted
+    
+    def _process_region(
+        self,
+        region_name: str,
+        bbox: List[float],
+        start_date: Union[str, datetime.datetime],
+        end_date: Union[str, datetime.datetime],
+        include_satellite: bool,
+        include_weather: bool,
+        store_in_db: bool,
+        weather_parquet_dir: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch (and optionally store) satellite and weather data for one region
+        
+        The satellite and weather fetches are independent, so they run
+        concurrently.
+        
+        Args:
+            region_name: Name of the region, used for logging
+            bbox: Bounding box [min_lon, min_lat, max_lon, max_lat]
+            start_date: Start date for data retrieval
+            end_date: End date for data retrieval
+            include_satellite: Whether to fetch satellite data
+            include_weather: Whether to fetch weather data
+            store_in_db: Whether to store the results in the database
+            weather_parquet_dir: If set, stream weather data through a Parquet
+                file in this directory instead of holding it in memory
+            
+        Returns:
+            Dictionary with the region's satellite and weather results
+        """
+        logger.info(f"Processing region: {region_name}")
+        region_results = {}
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            satellite_future = None
+            weather_future = None
+            
+            # Fetch satellite data
+            if include_satellite:
+                satellite_future = executor.submit(
+                    self.fetch_satellite_data,
+                    bbox=bbox,
+                    start_date=start_date,
+                    end_date=end_date,
+                    cloud_cover_max=30.0,
+                    max_results=5,
+                    download=False
+                )
+            
+            # Fetch weather data
+            if include_weather:
+                # Convert from [min_lon, min_lat, max_lon, max_lat] to [min_lat, min_lon, max_lat, max_lon]
+                weather_bbox = [bbox[1], bbox[0], bbox[3], bbox[2]]
+                
+                if weather_parquet_dir:
+                    weather_path = os.path.join(weather_parquet_dir, f"{region_name}.parquet")
+                    weather_future = executor.submit(
+                        self.fetch_weather_data_to_parquet,
+                        bbox=weather_bbox,
+                        start_date=start_date,
+                        end_date=end_date,
+                        output_path=weather_path
+                    )
+                else:
+                    weather_future = executor.submit(
+                        self.fetch_weather_data,
+                        bbox=weather_bbox,
+                        start_date=start_date,
+                        end_date=end_date
+                    )
+            
+            if satellite_future is not None:
+                satellite_data = satellite_future.result()
+                
+                region_results['satellite'] = {
+                    'count': satellite_data['count'],
+                    'product_ids': list(satellite_data['products'].keys())
+                }
+                
+                # Store in database
+                if store_in_db and satellite_data['count'] > 0:
+                    inserted = self.store_satellite_metadata(satellite_data['products'])
+                    region_results['satellite']['inserted'] = inserted
+            
+            if weather_future is not None and weather_parquet_dir:
+                weather_count = weather_future.result()
+                
+                region_results['weather'] = {
+                    'count': weather_count,
+                    'parquet_path': weather_path
+                }
+                
+                # Store in database
+                if store_in_db and weather_count > 0:
+                    inserted = self.store_weather_parquet(weather_path)
+                    region_results['weather']['inserted'] = inserted
+            
+            elif weather_future is not None:
+                weather_data = weather_future.result()
+                
+                region_results['weather'] = {
+                    'count': len(weather_data)
+                }
+                
+                # Store in database
+                if store_in_db and not weather_data.empty:
+                    inserted = self.store_weather_data(weather_data)
+                    region_results['weather']['inserted'] = inserted
+        
+        return region_results
+    
     def run_data_ingestion_pipeline(
         self,
         regions: List[Dict[str, Any]],
@@ -330,11 +1014,14 @@ class DataPipelineOrchestrator:
         end_date: Union[str, datetime.datetime],
         include_satellite: bool = True,
         include_weather: bool = True,
-        store_in_db: bool = True
+        store_in_db: bool = True,
+        weather_parquet_dir: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Run the complete data ingestion pipeline
         
+        Regions are processed concurrently, up to max_parallel_regions at a time.
+        
         Args:
             regions: List of regions to fetch data for, each with 'name' and 'bbox'
             start_date: Start date for data retrieval
@@ -342,28 +1029,104 @@ class DataPipelineOrchestrator:
             include_satellite: Whether to fetch satellite data
             include_weather: Whether to fetch weather data
             store_in_db: Whether to store the results in the database
+            weather_parquet_dir: If set, weather data for each region is streamed
+                to a Parquet file in this directory and loaded into the database
+                from there, keeping memory bounded on large runs
             
         Returns:
             Dictionary with results for each region
         """
         logger.info(f"Running data ingestion pipeline for {len(regions)} regions")
         
+        if weather_parquet_dir:
+            os.makedirs(weather_parquet_dir, exist_ok=True)
+        
         results = {}
         
-        for region in regions:
-            region_name = region.get('name', 'unknown')
-            bbox = region.get('bbox')
+        with ThreadPoolExecutor(max_workers=self.max_parallel_regions) as executor:
+            futures = {}
             
-            if not bbox:
-                logger.error(f"Region {region_name} has no bbox defined")
-                continue
+            for region in regions:
+                region_name = region.get('name', 'unknown')
+                bbox = region.get('bbox')
+                
+                if not bbox:
+                    logger.error(f"Region {region_name} has no bbox defined")
+                    continue
+                
+                future = executor.submit(
+                    self._process_region,
+                    region_name,
+                    bbox,
+                    start_date,
+                    end_date,
+                    include_satellite,
+                    include_weather,
+                    store_in_db,
+                    weather_parquet_dir
+                )
+                futures[future] = region_name
             
-            logger.info(f"Processing region: {region_name}")
-            results[region_name] = {}
+            for future in as_completed(futures):
+                region_name = futures[future]
+                try:
+                    results[region_name] = future.result()
+                except Exception as e:
+                    logger.error(f"Error processing region {region_name}: {str(e)}")
+                    results[region_name] = {'error': str(e)}
+        
+        logger.info(f"Completed data ingestion pipeline for {len(regions)} regions")
+        return results
+    
+    async def _process_region_async(
+        self,
+        region_name: str,
+        bbox: List[float],
+        start_date: Union[str, datetime.datetime],
+        end_date: Union[str, datetime.datetime],
+        include_satellite: bool,
+        include_weather: bool,
+        store_in_db: bool,
+        weather_parquet_dir: Optional[str],
+        semaphore: asyncio.Semaphore,
+        max_concurrency: int
+    ) -> Dict[str, Any]:
+        """
+        Fetch (and optionally store) satellite and weather data for one region
+        on the event loop
+        
+        Weather data is fetched with async requests. The Sentinel client and
+        the database inserts are blocking, so they run in the loop's executor.
+        
+        Args:
+            region_name: Name of the region, used for logging
+            bbox: Bounding box [min_lon, min_lat, max_lon, max_lat]
+            start_date: Start date for data retrieval
+            end_date: End date for data retrieval
+            include_satellite: Whether to fetch satellite data
+            include_weather: Whether to fetch weather data
+            store_in_db: Whether to store the results in the database
+            weather_parquet_dir: If set, stream weather data through a Parquet
+                file in this directory instead of holding it in memory
+            semaphore: Cap on NOAA requests in flight, shared between regions
+            max_concurrency: Connection limit of the NOAA HTTP client
             
-            # Fetch satellite data
-            if include_satellite:
-                satellite_data = self.fetch_satellite_data(
+        Returns:
+            Dictionary with the region's satellite and weather results
+        """
+        logger.info(f"Processing region: {region_name}")
+        loop = asyncio.get_running_loop()
+        region_results = {}
+        
+        satellite_future = None
+        weather_future = None
+        
+        # Fetch satellite data
+        if include_satellite:
+            satellite_future = loop.run_in_executor(
+                None,
+                functools.partial(
+                    self.fetch_satellite_data,
                     bbox=bbox,
                     start_date=start_date,
                     end_date=end_date,
@@ -371,38 +1134,157 @@ class DataPipelineOrchestrator:
                     max_results=5,
                     download=False
                 )
+            )
+        
+        # Fetch weather data
+        if include_weather:
+            # Convert from [min_lon, min_lat, max_lon, max_lat] to [min_lat, min_lon, max_lat, max_lon]
+            weather_bbox = [bbox[1], bbox[0], bbox[3], bbox[2]]
+            
+            if weather_parquet_dir:
+                weather_path = os.path.join(weather_parquet_dir, f"{region_name}.parquet")
+                weather_future = asyncio.ensure_future(self.fetch_weather_data_to_parquet_async(
+                    bbox=weather_bbox,
+                    start_date=start_date,
+                    end_date=end_date,
+                    output_path=weather_path,
+                    semaphore=semaphore,
+                    max_concurrency=max_concurrency
+                ))
+            else:
+                weather_future = asyncio.ensure_future(self.fetch_weather_data_async(
+                    bbox=weather_bbox,
+                    start_date=start_date,
+                    end_date=end_date,
+                    semaphore=semaphore,
+                    max_concurrency=max_concurrency
+                ))
+        
+        try:
+            if satellite_future is not None:
+                satellite_data = await satellite_future
                 
-                results[region_name]['satellite'] = {
+                region_results['satellite'] = {
                     'count': satellite_data['count'],
                     'product_ids': list(satellite_data['products'].keys())
                 }
                 
                 # Store in database
                 if store_in_db and satellite_data['count'] > 0:
-                    inserted = self.store_satellite_metadata(satellite_data['products'])
-                    results[region_name]['satellite']['inserted'] = inserted
+                    inserted = await loop.run_in_executor(None, self.store_satellite_metadata, satellite_data['products'])
+                    region_results['satellite']['inserted'] = inserted
             
-            # Fetch weather data
-            if include_weather:
-                # Convert from [min_lon, min_lat, max_lon, max_lat] to [min_lat, min_lon, max_lat, max_lon]
-                weather_bbox = [bbox[1], bbox[0], bbox[3], bbox[2]]
+            if weather_future is not None and weather_parquet_dir:
+                weather_count = await weather_future
                 
-                weather_data = self.fetch_weather_data(
-                    bbox=weather_bbox,
-                    start_date=start_date,
-                    end_date=end_date
-                )
+                region_results['weather'] = {
+                    'count': weather_count,
+                    'parquet_path': weather_path
+                }
                 
-                results[region_name]['weather'] = {
+                # Store in database
+                if store_in_db and weather_count > 0:
+                    inserted = await loop.run_in_executor(None, self.store_weather_parquet, weather_path)
+                    region_results['weather']['inserted'] = inserted
+            
+            elif weather_future is not None:
+                weather_data = await weather_future
+                
+                region_results['weather'] = {
                     'count': len(weather_data)
                 }
                 
                 # Store in database
                 if store_in_db and not weather_data.empty:
-                    inserted = self.store_weather_data(weather_data)
-                    results[region_name]['weather']['inserted'] = inserted
+                    inserted = await loop.run_in_executor(None, self.store_weather_data, weather_data)
+                    region_results['weather']['inserted'] = inserted
+        finally:
+            # Don't leave the weather fetch running if the satellite side failed
+            if weather_future is not None and not weather_future.done():
+                weather_future.cancel()
         
-        logger.info(f"Completed data ingestion pipeline for {len(regions)} regions")
+        return region_results
+    
+    async def run_data_ingestion_pipeline_async(
+        self,
+        regions: List[Dict[str, Any]],
+        start_date: Union[str, datetime.datetime],
+        end_date: Union[str, datetime.datetime],
+        include_satellite: bool = True,
+        include_weather: bool = True,
+        store_in_db: bool = True,
+        weather_parquet_dir: Optional[str] = None,
+        max_concurrent_requests: int = NOAA_ASYNC_MAX_CONCURRENCY
+    ) -> Dict[str, Any]:
+        """
+        Run the data ingestion pipeline on the event loop
+        
+        NOAA weather data is fetched with concurrent async requests, capped at
+        max_concurrent_requests across all regions, and written to Parquet (or
+        collected) as each station's data arrives. Sentinel searches and
+        database inserts stay on executor threads. Regions are processed
+        concurrently, up to max_parallel_regions at a time.
+        
+        Args:
+            regions: List of regions to fetch data for, each with 'name' and 'bbox'
+            start_date: Start date for data retrieval
+            end_date: End date for data retrieval
+            include_satellite: Whether to fetch satellite data
+            include_weather: Whether to fetch weather data
+            store_in_db: Whether to store the results in the database
+            weather_parquet_dir: If set, weather data for each region is streamed
+                to a Parquet file in this directory and loaded into the database
+                from there, keeping memory bounded on large runs
+            max_concurrent_requests: Maximum number of NOAA requests in flight
+            
+        Returns:
+            Dictionary with results for each region
+        """
+        logger.info(f"Running async data ingestion pipeline for {len(regions)} regions")
+        
+        if weather_parquet_dir:
+            os.makedirs(weather_parquet_dir, exist_ok=True)
+        
+        request_limit = asyncio.Semaphore(max_concurrent_requests)
+        region_limit = asyncio.Semaphore(self.max_parallel_regions)
+        
+        async def process(region_name: str, bbox: List[float]) -> Dict[str, Any]:
+            async with region_limit:
+                return await self._process_region_async(
+                    region_name,
+                    bbox,
+                    start_date,
+                    end_date,
+                    include_satellite,
+                    include_weather,
+                    store_in_db,
+                    weather_parquet_dir,
+                    request_limit,
+                    max_concurrent_requests
+                )
+        
+        region_names = []
+        tasks = []
+        for region in regions:
+            region_name = region.get('name', 'unknown')
+            bbox = region.get('bbox')
+            
+            if not bbox:
+                logger.error(f"Region {region_name} has no bbox defined")
+                continue
+            
+            region_names.append(region_name)
+            tasks.append(process(region_name, bbox))
+        
+        results = {}
+        for region_name, outcome in zip(region_names, await asyncio.gather(*tasks, return_exceptions=True)):
+            if isinstance(outcome, Exception):
+                logger.error(f"Error processing region {region_name}: {str(outcome)}")
+                results[region_name] = {'error': str(outcome)}
+            else:
+                results[region_name] = outcome
+        
+        logger.info(f"Completed async data ingestion pipeline for {len(regions)} regions")
         return results
 
 
@@ -2,32 +2,106 @@ import os
 import logging
 import datetime
 import json
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+import requests_cache
+import httpx
+import asyncio
 from typing import Dict, List, Optional, Any, Union, Tuple
+import numpy as np
 import pandas as pd
+import threading
+import cachetools
 import tempfile
+import uuid
+import shutil
 from pathlib import Path
 import rasterio
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# Module logger; handlers and levels are left to the application
 logger = logging.getLogger(__name__)
 
+# Headers for API calls; JSON compresses well, and urllib3 decodes Brotli
+# transparently when the brotli package is installed
+API_HEADERS = {
+    'Accept-Encoding': 'gzip, br',
+    'User-Agent': 'VisionEarth/1.0'
+}
+
+class _TransientRequestError(Exception):
+    """
+    A NASA API request failed in a way that may succeed on retry
+    (rate limiting, server errors, connection failures and timeouts)
+    """
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given in seconds (HTTP dates are ignored)
+    """
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+# Full-jitter exponential backoff, so workers rate limited at the same time
+# don't all retry at the same instant
+_jittered_backoff = wait_random_exponential(multiplier=1, max=30)
+
+def _wait_for_retry(retry_state) -> float:
+    """
+    tenacity wait strategy: jittered backoff, but never sooner than the
+    server's Retry-After
+    """
+    wait = _jittered_backoff(retry_state)
+    exception = retry_state.outcome.exception() if retry_state.outcome else None
+    retry_after = getattr(exception, 'retry_after', None)
+    return max(wait, retry_after) if retry_after is not None else wait
+
+def _format_date(value: Any) -> Any:
+    """
+    Format a date or datetime as YYYY-MM-DD, passing strings and None through
+    
+    Integer formatting avoids strftime's locale handling.
+    """
+    if isinstance(value, datetime.date):
+        return f"{value.year:04d}-{value.month:02d}-{value.day:02d}"
+    return value
+
+def _default_date_range(days: int = 30) -> Tuple[str, str]:
+    """
+    Get the (begin, end) date strings for the last number of days, ending today
+    """
+    today = datetime.date.today()
+    return (today - datetime.timedelta(days=days)).isoformat(), today.isoformat()
+
 class NASAEarthDataConnector:
     """
     Connector for NASA Earth data services
     Provides methods to access NASA's Earth Observation data, including MODIS, VIIRS, and Landsat
     """
     
+    # Bytes read from the network per iteration when downloading, and the size
+    # of the file write buffer that coalesces them
+    DOWNLOAD_CHUNK_SIZE = 256 * 1024
+    DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+    
     def __init__(
         self,
         api_key: Optional[str] = None,
-        base_url: str = 'https://api.nasa.gov/planetary'
+        base_url: str = 'https://api.nasa.gov/planetary',
+        session: Optional[requests.Session] = None,
+        cache_path: str = 'nasa_cache'
     ):
         """
         Initialize the NASA Earth Data connector
@@ -35,18 +109,67 @@ class NASAEarthDataConnector:
         Args:
             api_key: API key for NASA Earth Data API (defaults to env var NASA_API_KEY)
             base_url: Base URL for NASA API
+            session: HTTP session to send requests through (a pooled keep-alive
+                     session with an on-disk response cache is created if omitted)
+            cache_path: SQLite file for the response cache of the default session
         """
         self.api_key = api_key or os.getenv('NASA_API_KEY')
         self.base_url = base_url
         
+        if session is None:
+            # Cache API JSON responses on disk for a day (served stale if NASA
+            # errors); image downloads are streamed and never cached. The
+            # api_key parameter is excluded from cache keys by default.
+            session = requests_cache.CachedSession(
+                cache_path,
+                backend='sqlite',
+                expire_after=86400,
+                urls_expire_after={
+                    f"{base_url.split('://', 1)[-1]}/*": 86400,
+                    '*': requests_cache.DO_NOT_CACHE
+                },
+                allowable_methods=('GET',),
+                stale_if_error=True
+            )
+            session.cache.delete(expired=True)
+            
+            # Keep connections to api.nasa.gov and the image hosts alive across
+            # calls; retries are handled by tenacity in _make_request
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+        self.session = session
+        
+        # In-memory caches of parsed API responses, keyed by endpoint and
+        # rounded coordinates. Elevations never change, so they are only
+        # evicted by size. Guarded by a lock since the batch helpers call in
+        # from several threads.
+        self._cache_lock = threading.Lock()
+        self._elevation_cache = cachetools.LRUCache(maxsize=4096)
+        self._response_cache = cachetools.TTLCache(maxsize=512, ttl=3600)
+        
+        # Download directories already created, and the temporary directory
+        # used when no output path is given (created on first use)
+        self._made_dirs = set()
+        self._temp_download_dir: Optional[str] = None
+        
         if not self.api_key:
             logger.warning("NASA API key not provided. Set NASA_API_KEY environment variable.")
             logger.info("Using demo key which has rate limits.")
             self.api_key = 'DEMO_KEY'
         
+        # Built once and reused for every request
+        self._base_params = {'api_key': self.api_key}
+        self._endpoint_urls: Dict[str, str] = {}
+        
         logger.info("Initialized NASA Earth Data connector")
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=_wait_for_retry,
+        retry=retry_if_exception_type(_TransientRequestError),
+        retry_error_callback=lambda retry_state: None
+    )
     def _make_request(
         self, 
         endpoint: str, 
@@ -60,33 +183,153 @@ class NASAEarthDataConnector:
             params: Query parameters
             
         Returns:
-            Response data as dictionary
+            Response data as dictionary (None if the request failed, after
+            retrying rate limiting and transient errors)
         """
-        if params is None:
-            params = {}
-        
-        # Add API key to parameters
-        params['api_key'] = self.api_key
+        # Add API key to parameters (without modifying the caller's dict)
+        params = self._base_params if params is None else {**params, **self._base_params}
         
-        url = f"{self.base_url}/{endpoint}"
+        url = self._endpoint_urls.get(endpoint)
+        if url is None:
+            url = self._endpoint_urls[endpoint] = f"{self.base_url}/{endpoint}"
         
         try:
-            response = requests.get(url, params=params, timeout=30)
+            response = self.session.get(url, params=params, headers=API_HEADERS, timeout=30)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTP error: {e}")
-            if response.status_code == 429:
-                logger.warning("Rate limit exceeded. Retrying with exponential backoff.")
-                raise  # Retry with tenacity
+            logger.error("HTTP error: %s", e)
+            if response.status_code == 429 or response.status_code >= 500:
+                logger.warning("Rate limited or server error. Retrying with exponential backoff.")
+                raise _TransientRequestError(
+                    str(e),
+                    retry_after=_parse_retry_after(response.headers.get('Retry-After'))
+                ) from e  # Retry with tenacity
+            
+            # Other 4xx errors (bad parameters, auth) won't succeed on retry
             return None
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            logger.warning("Connection error: %s. Retrying with exponential backoff.", e)
+            raise _TransientRequestError(str(e)) from e
         except requests.exceptions.RequestException as e:
-            logger.error(f"Request error: {e}")
+            logger.error("Request error: %s", e)
             return None
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON decode error: {e}")
+        except json.JSONDecodeError as e:  # Also raised by orjson
+            logger.error("JSON decode error: %s", e)
             return None
     
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=_wait_for_retry,
+        retry=retry_if_exception_type(_TransientRequestError),
+        retry_error_callback=lambda retry_state: None
+    )
+    async def _make_request_async(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Make an API request to NASA APIs on an async HTTP/2 client
+        
+        Args:
+            client: Client created by _async_client
+            endpoint: API endpoint to call
+            params: Query parameters
+            
+        Returns:
+            Response data as dictionary (None if the request failed, after
+            retrying rate limiting and transient errors)
+        """
+        params = self._base_params if params is None else {**params, **self._base_params}
+        
+        try:
+            response = await client.get(endpoint, params=params)
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except httpx.HTTPStatusError as e:
+            logger.error("HTTP error: %s", e)
+            if response.status_code == 429 or response.status_code >= 500:
+                logger.warning("Rate limited or server error. Retrying with exponential backoff.")
+                raise _TransientRequestError(
+                    str(e),
+                    retry_after=_parse_retry_after(response.headers.get('Retry-After'))
+                ) from e
+            return None
+        except httpx.TransportError as e:
+            logger.warning("Connection error: %s. Retrying with exponential backoff.", e)
+            raise _TransientRequestError(str(e)) from e
+        except json.JSONDecodeError as e:  # Also raised by orjson
+            logger.error("JSON decode error: %s", e)
+            return None
+    
+    def _async_client(self, max_connections: int = 32) -> httpx.AsyncClient:
+        """
+        Create an HTTP/2 client for the NASA API
+        
+        Concurrent requests are multiplexed over one TLS connection. The client
+        is bound to the running event loop, so create one per batch and close it.
+        """
+        return httpx.AsyncClient(
+            http2=True,
+            base_url=f"{self.base_url}/",
+            headers=API_HEADERS,
+            timeout=30,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        )
+    
+    def _cached_request(
+        self,
+        cache: cachetools.Cache,
+        key: Tuple[Any, ...],
+        endpoint: str,
+        params: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Make an API request, reusing a cached response for the same key
+        
+        Failed requests are not cached.
+        
+        Args:
+            cache: Cache to look the response up in
+            key: Cache key identifying the request
+            endpoint: API endpoint to call
+            params: Query parameters
+            
+        Returns:
+            Response data as dictionary
+        """
+        with self._cache_lock:
+            response = cache.get(key)
+        if response is not None:
+            return response
+        
+        response = self._make_request(endpoint, params)
+        
+        if response:
+            with self._cache_lock:
+                cache[key] = response
+        return response
+    
+    def _ensure_dir(self, path: str) -> None:
+        """
+        Create a directory unless this connector already created it
+        """
+        if path not in self._made_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._made_dirs.add(path)
+    
+    def _get_temp_download_dir(self) -> str:
+        """
+        Get the temporary directory for downloads without an output path
+        """
+        if self._temp_download_dir is None:
+            with self._cache_lock:
+                if self._temp_download_dir is None:
+                    self._temp_download_dir = tempfile.mkdtemp(prefix='nasa_')
+        return self._temp_download_dir
+    
     def get_earth_imagery(
         self,
         lat: float,
@@ -109,8 +352,7 @@ class NASAEarthDataConnector:
             Dictionary with image URL and metadata
         """
         # Convert date to string if it's a datetime object
-        if isinstance(date, datetime.datetime):
-            date = date.strftime('%Y-%m-%d')
+        date = _format_date(date)
         
         params = {
             'lat': lat,
@@ -122,25 +364,122 @@ class NASAEarthDataConnector:
         if date:
             params['date'] = date
         
-        logger.info(f"Fetching Earth imagery for location ({lat}, {lon})")
+        logger.debug("Fetching Earth imagery for location (%s, %s)", lat, lon)
         
-        response = self._make_request('earth/imagery', params)
+        response = self._cached_request(
+            self._response_cache,
+            ('earth/imagery', round(lat, 4), round(lon, 4), date, cloud_score, dim),
+            'earth/imagery',
+            params
+        )
         
         if response:
-            logger.info(f"Retrieved Earth imagery for ({lat}, {lon}), date: {response.get('date')}")
+            logger.debug("Retrieved Earth imagery for (%s, %s), date: %s", lat, lon, response.get('date'))
             
-            # Add coordinates to response for reference
-            response['coordinates'] = {
-                'lat': lat,
-                'lon': lon,
-                'dim': dim
+            # Add coordinates to a copy of the (possibly cached) response for reference
+            return {
+                **response,
+                'coordinates': {
+                    'lat': lat,
+                    'lon': lon,
+                    'dim': dim
+                }
             }
-            
-            return response
         
-        logger.warning(f"Failed to retrieve Earth imagery for ({lat}, {lon})")
+        logger.warning("Failed to retrieve Earth imagery for (%s, %s)", lat, lon)
         return None
     
+    def get_earth_imagery_many(
+        self,
+        points: List[Tuple[float, float]],  # [(lat, lon), ...]
+        date: Optional[Union[str, datetime.datetime]] = None,
+        cloud_score: bool = True,
+        dim: float = 0.15,
+        max_workers: int = 16
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get Earth imagery for many locations concurrently
+        
+        Args:
+            points: List of (lat, lon) tuples in decimal degrees
+            date: Date for the imagery (if None, use most recent)
+            cloud_score: Whether to calculate cloud score
+            dim: Width and height of each image in degrees
+            max_workers: Maximum number of requests in flight
+            
+        Returns:
+            List of imagery dictionaries in the order of points (None where a request failed)
+        """
+        def fetch(point: Tuple[float, float]) -> Optional[Dict[str, Any]]:
+            lat, lon = point
+            try:
+                return self.get_earth_imagery(lat, lon, date=date, cloud_score=cloud_score, dim=dim)
+            except Exception as e:
+                logger.error("Error fetching Earth imagery for (%s, %s): %s", lat, lon, e)
+                return None
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fetch, points))
+    
+    async def get_earth_imagery_many_async(
+        self,
+        points: List[Tuple[float, float]],  # [(lat, lon), ...]
+        date: Optional[Union[str, datetime.datetime]] = None,
+        cloud_score: bool = True,
+        dim: float = 0.15,
+        max_concurrency: int = 32
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get Earth imagery for many locations from async code, multiplexing
+        the requests over one HTTP/2 connection
+        
+        Args:
+            points: List of (lat, lon) tuples in decimal degrees
+            date: Date for the imagery (if None, use most recent)
+            cloud_score: Whether to calculate cloud score
+            dim: Width and height of each image in degrees
+            max_concurrency: Maximum number of requests in flight
+            
+        Returns:
+            List of imagery dictionaries in the order of points (None where a request failed)
+        """
+        date = _format_date(date)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def fetch(client: httpx.AsyncClient, lat: float, lon: float) -> Optional[Dict[str, Any]]:
+            key = ('earth/imagery', round(lat, 4), round(lon, 4), date, cloud_score, dim)
+            with self._cache_lock:
+                response = self._response_cache.get(key)
+            
+            if response is None:
+                params = {
+                    'lat': lat,
+                    'lon': lon,
+                    'cloud_score': str(cloud_score).lower(),
+                    'dim': dim
+                }
+                if date:
+                    params['date'] = date
+                
+                async with semaphore:
+                    response = await self._make_request_async(client, 'earth/imagery', params)
+                
+                if not response:
+                    logger.warning("Failed to retrieve Earth imagery for (%s, %s)", lat, lon)
+                    return None
+                with self._cache_lock:
+                    self._response_cache[key] = response
+            
+            return {**response, 'coordinates': {'lat': lat, 'lon': lon, 'dim': dim}}
+        
+        async with self._async_client(max_connections=max_concurrency) as client:
+            results = await asyncio.gather(
+                *(fetch(client, lat, lon) for lat, lon in points),
+                return_exceptions=True
+            )
+        
+        return [None if isinstance(result, Exception) else result for result in results]
+    
     def get_earth_assets(
         self,
         lat: float,
@@ -161,16 +500,14 @@ class NASAEarthDataConnector:
             List of available image assets with metadata
         """
         # Set default date range if not provided
-        if not begin_date:
-            begin_date = datetime.datetime.now() - datetime.timedelta(days=30)
-        if not end_date:
-            end_date = datetime.datetime.now()
+        if not begin_date or not end_date:
+            default_begin, default_end = _default_date_range()
+            begin_date = begin_date or default_begin
+            end_date = end_date or default_end
         
         # Convert dates to strings if they are datetime objects
-        if isinstance(begin_date, datetime.datetime):
-            begin_date = begin_date.strftime('%Y-%m-%d')
-        if isinstance(end_date, datetime.datetime):
-            end_date = end_date.strftime('%Y-%m-%d')
+        begin_date = _format_date(begin_date)
+        end_date = _format_date(end_date)
         
         params = {
             'lat': lat,
@@ -179,17 +516,61 @@ class NASAEarthDataConnector:
             'end': end_date
         }
         
-        logger.info(f"Fetching Earth assets for location ({lat}, {lon}) from {begin_date} to {end_date}")
+        logger.debug("Fetching Earth assets for location (%s, %s) from %s to %s", lat, lon, begin_date, end_date)
         
-        response = self._make_request('earth/assets', params)
+        response = self._cached_request(
+            self._response_cache,
+            ('earth/assets', round(lat, 4), round(lon, 4), begin_date, end_date),
+            'earth/assets',
+            params
+        )
         
         if response and 'results' in response:
-            logger.info(f"Retrieved {len(response['results'])} Earth assets for ({lat}, {lon})")
+            logger.debug("Retrieved %s Earth assets for (%s, %s)", len(response['results']), lat, lon)
             return response['results']
         
-        logger.warning(f"Failed to retrieve Earth assets for ({lat}, {lon})")
+        logger.warning("Failed to retrieve Earth assets for (%s, %s)", lat, lon)
         return []
     
+    def get_earth_assets_bulk(
+        self,
+        points: List[Tuple[float, float]],  # [(lat, lon), ...]
+        begin_date: Optional[Union[str, datetime.datetime]] = None,
+        end_date: Optional[Union[str, datetime.datetime]] = None,
+        max_workers: int = 16
+    ) -> Dict[Tuple[float, float], List[Dict[str, Any]]]:
+        """
+        Get available Earth image assets for many locations concurrently
+        
+        Args:
+            points: List of (lat, lon) tuples in decimal degrees
+            begin_date: Start date for the search range (if None, defaults to 30 days ago)
+            end_date: End date for the search range (if None, defaults to today)
+            max_workers: Maximum number of requests in flight
+            
+        Returns:
+            Dictionary mapping each (lat, lon) point to its list of assets
+        """
+        def fetch(point: Tuple[float, float]) -> List[Dict[str, Any]]:
+            lat, lon = point
+            try:
+                return self.get_earth_assets(lat, lon, begin_date=begin_date, end_date=end_date) or []
+            except Exception as e:
+                logger.error("Error fetching Earth assets for (%s, %s): %s", lat, lon, e)
+                return []
+        
+        # Resolve the default date range once for the whole batch
+        if not begin_date or not end_date:
+            default_begin, default_end = _default_date_range()
+            begin_date = begin_date or default_begin
+            end_date = end_date or default_end
+        
+        # Duplicate points are only requested once
+        unique_points = list(dict.fromkeys(points))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(unique_points, executor.map(fetch, unique_points)))
+    
     def download_image(
         self,
         image_url: str,
@@ -208,28 +589,170 @@ class NASAEarthDataConnector:
         try:
             # Create output directory if it doesn't exist
             if output_path:
-                os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+                self._ensure_dir(os.path.dirname(os.path.abspath(output_path)))
             else:
-                # Generate a temporary file path
-                tmp_dir = tempfile.mkdtemp()
-                output_path = os.path.join(tmp_dir, "nasa_image.jpg")
+                # Generate a unique file path in the connector's temporary directory
+                output_path = os.path.join(self._get_temp_download_dir(), f"{uuid.uuid4().hex}.jpg")
             
             # Download the image
-            response = requests.get(image_url, stream=True, timeout=30)
+            response = self.session.get(image_url, stream=True, timeout=30)
             response.raise_for_status()
             
-            # Save to file
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            # Save to file, copying from the raw stream in C rather than a Python loop
+            response.raw.decode_content = True
+            content_length = response.headers.get('Content-Length')
+            with open(output_path, 'wb', buffering=self.DOWNLOAD_BUFFER_SIZE) as f:
+                # Preallocate the file when the size on disk is known up front
+                if content_length and 'Content-Encoding' not in response.headers and hasattr(os, 'posix_fallocate'):
+                    os.posix_fallocate(f.fileno(), 0, int(content_length))
+                
+                shutil.copyfileobj(response.raw, f, length=self.DOWNLOAD_CHUNK_SIZE)
+                
+                # Drop any preallocated space left by a short read
+                f.truncate(f.tell())
             
-            logger.info(f"Downloaded image to {output_path}")
+            logger.info("Downloaded image to %s", output_path)
             return output_path
         
         except Exception as e:
-            logger.error(f"Error downloading image from {image_url}: {str(e)}")
+            logger.error("Error downloading image from %s: %s", image_url, e)
             return None
     
+    def download_image_parallel(
+        self,
+        image_url: str,
+        output_path: str,
+        part_size: int = 16 * 1024 * 1024,
+        max_workers: int = 8
+    ) -> Optional[str]:
+        """
+        Download a large file as concurrent byte ranges
+        
+        Falls back to a single-stream download when the server doesn't
+        support range requests or the file fits in one part.
+        
+        Args:
+            image_url: URL of the file to download
+            output_path: Path to save the downloaded file
+            part_size: Size of each byte range in bytes
+            max_workers: Maximum number of ranges downloaded at once
+            
+        Returns:
+            Path to the downloaded file
+        """
+        # Ranges address the bytes as stored, so ask for them uncompressed
+        headers = {'Accept-Encoding': 'identity'}
+        
+        try:
+            head = self.session.head(image_url, headers=headers, allow_redirects=True, timeout=30)
+            head.raise_for_status()
+            size = int(head.headers.get('Content-Length', 0))
+            accepts_ranges = head.headers.get('Accept-Ranges', 'none').lower() == 'bytes'
+        except Exception as e:
+            logger.warning("HEAD request for %s failed (%s), downloading as a single stream", image_url, e)
+            return self.download_image(image_url, output_path)
+        
+        if not accepts_ranges or size <= part_size:
+            return self.download_image(image_url, output_path)
+        
+        def download_part(fd: int, start: int, end: int) -> None:
+            response = self.session.get(
+                head.url,
+                headers={**headers, 'Range': f"bytes={start}-{end - 1}"},
+                stream=True,
+                timeout=30
+            )
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise IOError(f"Server ignored range request for bytes {start}-{end - 1}")
+            
+            # pwrite takes an explicit offset, so parts can be written concurrently
+            offset = start
+            for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                os.pwrite(fd, chunk, offset)
+                offset += len(chunk)
+            
+            if offset != end:
+                raise IOError(f"Short read for bytes {start}-{end - 1}: got {offset - start} bytes")
+        
+        try:
+            self._ensure_dir(os.path.dirname(os.path.abspath(output_path)))
+            
+            fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.ftruncate(fd, size)
+                
+                ranges = [(start, min(start + part_size, size)) for start in range(0, size, part_size)]
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [executor.submit(download_part, fd, start, end) for start, end in ranges]
+                    for future in futures:
+                        future.result()
+            finally:
+                os.close(fd)
+            
+            logger.info("Downloaded %s bytes in %s parts to %s", size, len(ranges), output_path)
+            return output_path
+        
+        except Exception as e:
+            logger.error("Error downloading %s in parts: %s", image_url, e)
+            return None
+    
+    def download_images(
+        self,
+        image_urls: List[str],
+        output_dir: Optional[str] = None,
+        max_workers: int = 8
+    ) -> List[Optional[str]]:
+        """
+        Download several images concurrently
+        
+        Args:
+            image_urls: URLs of the images to download
+            output_dir: Directory to save the images in (a temporary directory if None)
+            max_workers: Maximum number of downloads in flight
+            
+        Returns:
+            List of downloaded file paths in the order of image_urls (None where a download failed)
+        """
+        if not output_dir:
+            output_dir = tempfile.mkdtemp()
+        
+        # Index the file names so URLs ending in the same name don't collide
+        output_paths = [
+            os.path.join(output_dir, f"{i}_{os.path.basename(url.split('?')[0]) or 'nasa_image.jpg'}")
+            for i, url in enumerate(image_urls)
+        ]
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.download_image, image_urls, output_paths))
+    
+    def download_assets(
+        self,
+        assets: Dict[str, Dict[str, Any]],
+        output_dir: str,
+        max_workers: int = 8
+    ) -> Dict[str, Optional[str]]:
+        """
+        Download the assets of a scene (e.g. the bands of a Landsat scene) concurrently
+        
+        Args:
+            assets: Mapping of asset name to asset metadata with an 'href'
+            output_dir: Directory to save the assets in
+            max_workers: Maximum number of downloads in flight
+            
+        Returns:
+            Dictionary mapping asset names to downloaded file paths (None where a download failed)
+        """
+        names = [name for name, asset in assets.items() if asset.get('href')]
+        urls = [assets[name]['href'] for name in names]
+        output_paths = [
+            os.path.join(output_dir, os.path.basename(url.split('?')[0]) or f"{name}.tif")
+            for name, url in zip(names, urls)
+        ]
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(names, executor.map(self.download_image, urls, output_paths)))
+    
     def get_landsat_imagery(
         self,
         bbox: Tuple[float, float, float, float],  # (west, south, east, north)
@@ -252,8 +775,8 @@ class NASAEarthDataConnector:
         Returns:
             List of image metadata
         """
-        logger.info(f"This is a placeholder implementation for Landsat imagery retrieval")
-        logger.info(f"In a production system, this would connect to NASA CMR or Earth Engine API")
+        logger.info("This is a placeholder implementation for Landsat imagery retrieval")
+        logger.info("In a production system, this would connect to NASA CMR or Earth Engine API")
         
         # This is a simplified mock implementation
         # In production, this would use NASA's Common Metadata Repository (CMR) or Earth Engine
@@ -307,8 +830,8 @@ class NASAEarthDataConnector:
         Returns:
             Dictionary with metadata and file paths
         """
-        logger.info(f"This is a placeholder implementation for MODIS data retrieval")
-        logger.info(f"In a production system, this would connect to NASA LPDAAC or AppEEARS API")
+        logger.info("This is a placeholder implementation for MODIS data retrieval")
+        logger.info("In a production system, this would connect to NASA LPDAAC or AppEEARS API")
         
         # This is a simplified mock implementation
         # In production, this would use NASA LPDAAC or AppEEARS API
@@ -316,7 +839,7 @@ class NASAEarthDataConnector:
         # Mock data for demonstration
         mock_result = {
             'product': product,
-            'date': date.strftime('%Y-%m-%d') if isinstance(date, datetime.datetime) else date,
+            'date': _format_date(date),
             'bbox': bbox,
             'status': 'available',
             'files': [
@@ -405,14 +928,12 @@ class NASAEarthDataConnector:
             Dictionary with image URL and metadata
         """
         # Convert date to string if it's a datetime object
-        if isinstance(date, datetime.datetime):
-            date = date.strftime('%Y-%m-%d')
+        date = _format_date(date)
         
         # If no date specified, use most recent
         if not date:
-            today = datetime.datetime.now()
             # Use first of current month as a default
-            date = today.replace(day=1).strftime('%Y-%m-%d')
+            date = datetime.date.today().replace(day=1).isoformat()
         
         # Mock response that would be similar to actual NEO API response
         mock_response = {
@@ -449,18 +970,61 @@ class NASAEarthDataConnector:
             'lon': lon
         }
         
-        response = self._make_request(endpoint, params)
+        response = self._cached_request(
+            self._elevation_cache,
+            (round(lat, 4), round(lon, 4)),
+            endpoint,
+            params
+        )
         
         if response and 'elevation' in response:
-            logger.info(f"Retrieved elevation for ({lat}, {lon}): {response['elevation']} meters")
+            logger.debug("Retrieved elevation for (%s, %s): %s meters", lat, lon, response['elevation'])
             return response['elevation']
         
-        logger.warning(f"Failed to retrieve elevation for ({lat}, {lon})")
+        logger.warning("Failed to retrieve elevation for (%s, %s)", lat, lon)
         return None
+    
+    def get_srtm_elevation_grid(
+        self,
+        lats: np.ndarray,
+        lons: np.ndarray,
+        max_workers: int = 16
+    ) -> np.ndarray:
+        """
+        Get SRTM elevations for arrays of coordinates, e.g. a grid from np.meshgrid
+        
+        Args:
+            lats: Latitudes in decimal degrees
+            lons: Longitudes in decimal degrees (broadcast against lats)
+            max_workers: Maximum number of requests in flight
+            
+        Returns:
+            Float array of elevations in meters with the broadcast shape of the
+            inputs (NaN where no elevation could be retrieved)
+        """
+        lats, lons = np.broadcast_arrays(np.asarray(lats, dtype=float), np.asarray(lons, dtype=float))
+        
+        # One conversion to Python floats for all points instead of per-element boxing
+        points = np.column_stack((lats.ravel(), lons.ravel())).tolist()
+        
+        def fetch(point: List[float]) -> float:
+            try:
+                elevation = self.get_srtm_elevation(point[0], point[1])
+            except Exception as e:
+                logger.error("Error fetching elevation for (%s, %s): %s", point[0], point[1], e)
+                return np.nan
+            return np.nan if elevation is None else elevation
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            elevations = np.fromiter(executor.map(fetch, points), dtype=float, count=len(points))
+        
+        return elevations.reshape(lats.shape)
 
 
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
     # Initialize connector
     connector = NASAEarthDataConnector()
     
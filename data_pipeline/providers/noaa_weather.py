@@ -1,16 +1,35 @@
 import os
 import logging
 import datetime
-import json
+import hashlib
+import functools
+import shutil
+import uuid
+from urllib.parse import urlencode
+import orjson
+import redis
 import requests
-from typing import Dict, List, Optional, Any, Union
+import httpx
+import boto3
+from botocore import UNSIGNED
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+from boto3.s3.transfer import TransferConfig
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Any, Tuple, Union
 import pandas as pd
+import pyarrow as pa
 import tempfile
+from xml.etree import ElementTree
 from pathlib import Path
-import netCDF4 as nc
-import xarray as xr
 from dotenv import load_dotenv
 
+if TYPE_CHECKING:
+    import xarray as xr
+
 # Load environment variables
 load_dotenv()
 
@@ -18,6 +37,148 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Response cache lifetimes per CDO endpoint, in seconds; endpoints not listed
+# are not cached. Stale copies are kept longer and served if NOAA fails.
+CACHE_TTLS = {
+    'datasets': 86400,
+    'datacategories': 86400,
+    'stations': 3600,
+    'data': 300
+}
+CACHE_STALE_TTL = 7 * 86400
+
+# Copy size for streaming GOES files (tens of MB each) to disk
+GOES_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Layout of the public GOES buckets: one bucket per satellite, one prefix per product hour
+GOES_BUCKET_TEMPLATE = 'noaa-goes{sat_num}'
+GOES_PREFIX_TEMPLATE = '{product}/{year}/{doy:03d}/{hour:02d}/'
+
+# Multipart settings for GOES downloads through boto3: files above the
+# threshold are fetched as parallel ranged GETs
+GOES_TRANSFER_CONFIG = TransferConfig(multipart_threshold=8 * 1024 * 1024, max_concurrency=8)
+
+# Dask chunk sizes for NetCDF grids; dimensions a file doesn't have are ignored
+NETCDF_CHUNKS = {'x': 1024, 'y': 1024}
+
+# Ancillary variables of known products (keyed by the product part of the
+# file name), skipped when opening a file for specific variables
+ABI_L2_AUX = [
+    'DQF', 'time_bounds', 'y_image', 'y_image_bounds', 'x_image', 'x_image_bounds',
+    'nominal_satellite_subpoint_lat', 'nominal_satellite_subpoint_lon', 'nominal_satellite_height',
+    'geospatial_lat_lon_extent', 'band_id', 'band_wavelength', 'band_wavelength_star_look',
+    'total_number_of_points', 'valid_pixel_count', 'outlier_pixel_count',
+    'min_reflectance_factor', 'max_reflectance_factor', 'mean_reflectance_factor', 'std_dev_reflectance_factor',
+    'min_brightness_temperature', 'max_brightness_temperature', 'mean_brightness_temperature',
+    'std_dev_brightness_temperature', 'percent_uncorrectable_GRB_errors', 'percent_uncorrectable_L0_errors',
+    't_star_look', 'star_id', 'algorithm_dynamic_input_data_container',
+    'processing_parm_version_container', 'algorithm_product_version_container'
+]
+KNOWN_AUX = {
+    'ABI-L2-CMIP': ABI_L2_AUX,
+    'ABI-L2-MCMIP': ABI_L2_AUX,
+    'ABI-L1b-Rad': ABI_L2_AUX + [
+        'earth_sun_distance_anomaly_in_AU', 'kappa0', 'planck_fk1', 'planck_fk2', 'planck_bc1',
+        'planck_bc2', 'esun', 'yaw_flip_flag', 'focal_plane_temperature_threshold_exceeded_count',
+        'maximum_focal_plane_temperature', 'focal_plane_temperature_threshold_increasing',
+        'focal_plane_temperature_threshold_decreasing', 'min_radiance_value_of_valid_pixels',
+        'max_radiance_value_of_valid_pixels', 'mean_radiance_value_of_valid_pixels',
+        'std_dev_radiance_value_of_valid_pixels'
+    ]
+}
+DEFAULT_AUX: List[str] = []
+
+def _aux_variables(file_path: str) -> List[str]:
+    """
+    Look up the ancillary variables of a file from its product name
+    (e.g. 'ABI-L2-CMIPF-M6C01' in 'OR_ABI-L2-CMIPF-M6C01_G16_s...nc')
+    """
+    parts = os.path.basename(file_path).split('_')
+    product = parts[1] if len(parts) > 1 else ''
+    for prefix, aux in KNOWN_AUX.items():
+        if product.startswith(prefix):
+            return aux
+    return DEFAULT_AUX
+
+# Default directory for Zarr copies of NetCDF files
+ZARR_CACHE_DIR = 'noaa_zarr_cache'
+
+# Bytes of a NetCDF file hashed (with its size) to name its Zarr copy
+ZARR_KEY_BYTES = 65536
+
+# XML namespace of S3 ListObjectsV2 responses
+S3_XML_NAMESPACE = '{http://s3.amazonaws.com/doc/2006-03-01/}'
+
+# Arrow schema of CDO data records; station and datatype repeat heavily,
+# so they are dictionary encoded (categoricals in pandas)
+DATA_SCHEMA = pa.schema([
+    ('date', pa.string()),
+    ('datatype', pa.dictionary(pa.int32(), pa.string())),
+    ('station', pa.dictionary(pa.int32(), pa.string())),
+    ('attributes', pa.string()),
+    ('value', pa.float64())
+])
+
+def _data_table(results: List[Dict[str, Any]]) -> pa.Table:
+    """
+    Build an Arrow table from CDO data records column by column
+    
+    The schema is fixed, so no per-record type inference is needed.
+    Dates are kept as the ISO strings NOAA returns.
+    
+    Args:
+        results: Records from the 'results' field of a data response
+        
+    Returns:
+        Table with the DATA_SCHEMA columns
+    """
+    return pa.table({
+        'date': pa.array([record.get('date') for record in results], pa.string()),
+        'datatype': pa.array([record.get('datatype') for record in results], pa.string()).dictionary_encode(),
+        'station': pa.array([record.get('station') for record in results], pa.string()).dictionary_encode(),
+        'attributes': pa.array([record.get('attributes') for record in results], pa.string()),
+        'value': pa.array([record.get('value') for record in results], pa.float64())
+    }, schema=DATA_SCHEMA)
+
+def _data_frame(results: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Build a DataFrame from CDO data records via an Arrow table
+    
+    Args:
+        results: Records from the 'results' field of a data response
+        
+    Returns:
+        DataFrame with the DATA_SCHEMA columns
+    """
+    return _data_table(results).to_pandas(split_blocks=True, self_destruct=True)
+
+@functools.lru_cache(maxsize=32)
+def _open_netcdf(
+    path: str,
+    mtime: float,
+    engine: str,
+    decode_times: bool,
+    drop_variables: Tuple[str, ...]
+) -> 'xr.Dataset':
+    """
+    Open a NetCDF file lazily, reusing the open dataset for repeated calls
+    
+    The modification time is part of the cache key, so a rewritten file is reopened.
+    """
+    # Imported here so connectors that never touch NetCDF don't pay for
+    # loading xarray and the HDF5 libraries
+    import xarray as xr
+    
+    return xr.open_dataset(
+        path,
+        engine=engine,
+        chunks=NETCDF_CHUNKS,
+        mask_and_scale=True,
+        decode_cf=True,
+        decode_times=decode_times,
+        drop_variables=list(drop_variables) or None
+    )
+
 class NOAAWeatherConnector:
     """
     Connector for NOAA weather data services
@@ -27,7 +188,8 @@ class NOAAWeatherConnector:
     def __init__(
         self,
         api_key: Optional[str] = None,
-        base_url: str = 'https://www.ncdc.noaa.gov/cdo-web/api/v2'
+        base_url: str = 'https://www.ncdc.noaa.gov/cdo-web/api/v2',
+        session: Optional[requests.Session] = None
     ):
         """
         Initialize the NOAA weather data connector
@@ -36,15 +198,65 @@ class NOAAWeatherConnector:
             api_key: API key for NOAA Climate Data Online (CDO) API
                      (defaults to env var NOAA_API_KEY)
             base_url: Base URL for the NOAA CDO API
+            session: HTTP session to send requests through, so connections are
+                     kept alive between calls (a pooled session with retries
+                     is created if omitted)
         """
         self.api_key = api_key or os.getenv('NOAA_API_KEY')
         self.base_url = base_url
         
+        # The API token is sent per request rather than set on the session,
+        # since a shared session also talks to other providers
+        self._owns_session = session is None
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=32,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    respect_retry_after_header=True
+                )
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+        self.session = session
+        
+        # Optional shared response cache, enabled by setting REDIS_URL
+        redis_url = os.getenv('REDIS_URL')
+        self.cache = redis.Redis.from_url(redis_url) if redis_url else None
+        
         if not self.api_key:
             logger.warning("NOAA API key not provided. Set NOAA_API_KEY environment variable.")
+            
+            # Every request would be rejected, so skip them outright
+            self._make_request = self._request_without_key
+            self._make_request_async = self._request_without_key_async
         else:
             logger.info("Initialized NOAA Weather connector")
     
+    @functools.cached_property
+    def s3(self):
+        """
+        Anonymous S3 client for the public GOES buckets, created on first use
+        """
+        return boto3.client('s3', config=Config(signature_version=UNSIGNED))
+    
+    def close(self) -> None:
+        """
+        Close the HTTP session if this connector created it
+        """
+        if self._owns_session:
+            self.session.close()
+    
+    def __enter__(self) -> 'NOAAWeatherConnector':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
     def _make_request(
         self, 
         endpoint: str, 
@@ -60,9 +272,13 @@ class NOAAWeatherConnector:
         Returns:
             Response data as dictionary
         """
-        if not self.api_key:
-            logger.error("NOAA API key not provided. Cannot make request.")
-            return None
+        ttl = CACHE_TTLS.get(endpoint) if self.cache is not None else None
+        if ttl:
+            query = urlencode(sorted((params or {}).items()), doseq=True)
+            key = f"noaa:{hashlib.blake2b(f'{endpoint}?{query}'.encode(), digest_size=16).hexdigest()}"
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
         
         headers = {
             'token': self.api_key
@@ -71,17 +287,114 @@ class NOAAWeatherConnector:
         url = f"{self.base_url}/{endpoint}"
         
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self.session.get(url, headers=headers, params=params)
             response.raise_for_status()
-            return response.json()
+            data = orjson.loads(response.content)
         except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTP error: {e}")
-            return None
+            logger.error("HTTP error: %s", e)
+            return self._cache_get(f"{key}:stale") if ttl else None
         except requests.exceptions.RequestException as e:
-            logger.error(f"Request error: {e}")
+            logger.error("Request error: %s", e)
+            return self._cache_get(f"{key}:stale") if ttl else None
+        except orjson.JSONDecodeError as e:
+            logger.error("JSON decode error: %s", e)
+            return None
+        
+        if ttl:
+            self._cache_set(key, data, ttl)
+        return data
+    
+    def _request_without_key(self, endpoint: str, params: Dict[str, Any] = None) -> None:
+        """
+        Stand-in for _make_request when no API key is configured
+        """
+        logger.debug("NOAA API key not provided, skipping %s request", endpoint)
+        return None
+    
+    async def _request_without_key_async(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        params: Dict[str, Any] = None
+    ) -> None:
+        """
+        Stand-in for _make_request_async when no API key is configured
+        """
+        logger.debug("NOAA API key not provided, skipping %s request", endpoint)
+        return None
+    
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a cached response, treating Redis errors as a miss
+        """
+        try:
+            cached = self.cache.get(key)
+        except redis.RedisError as e:
+            logger.warning("Redis error reading %s: %s", key, e)
+            return None
+        if cached is None:
+            return None
+        try:
+            return orjson.loads(cached)
+        except orjson.JSONDecodeError as e:
+            logger.warning("Unreadable cache entry %s: %s", key, e)
+            return None
+    
+    def _cache_set(self, key: str, data: Dict[str, Any], ttl: int) -> None:
+        """
+        Cache a response, plus a longer-lived stale copy for when NOAA is unavailable
+        """
+        payload = orjson.dumps(data)
+        try:
+            with self.cache.pipeline() as pipe:
+                pipe.set(key, payload, ex=ttl)
+                pipe.set(f"{key}:stale", payload, ex=CACHE_STALE_TTL)
+                pipe.execute()
+        except redis.RedisError as e:
+            logger.warning("Redis error writing %s: %s", key, e)
+    
+    def _async_client(self, max_connections: int = 32) -> httpx.AsyncClient:
+        """
+        Create an async client for the NOAA CDO API
+        
+        The client is bound to the running event loop, so create one per batch and close it.
+        """
+        return httpx.AsyncClient(
+            base_url=f"{self.base_url}/",
+            headers={'token': self.api_key or ''},
+            timeout=30,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        )
+    
+    async def _make_request_async(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        params: Dict[str, Any] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Make an API request to NOAA on an async client
+        
+        Args:
+            client: Client created by _async_client
+            endpoint: API endpoint to call
+            params: Query parameters
+            
+        Returns:
+            Response data as dictionary
+        """
+        try:
+            response = await client.get(endpoint, params=params)
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except httpx.HTTPStatusError as e:
+            logger.error("HTTP error: %s", e)
             return None
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON decode error: {e}")
+        except httpx.HTTPError as e:
+            logger.error("Request error: %s", e)
+            return None
+        except orjson.JSONDecodeError as e:
+            logger.error("JSON decode error: %s", e)
             return None
     
     def get_available_datasets(self) -> List[Dict[str, Any]]:
@@ -93,7 +406,7 @@ class NOAAWeatherConnector:
         """
         response = self._make_request('datasets')
         if response and 'results' in response:
-            logger.info(f"Retrieved {len(response['results'])} available datasets")
+            logger.info("Retrieved %d available datasets", len(response['results']))
             return response['results']
         return []
     
@@ -106,7 +419,7 @@ class NOAAWeatherConnector:
         """
         response = self._make_request('datacategories')
         if response and 'results' in response:
-            logger.info(f"Retrieved {len(response['results'])} available data categories")
+            logger.info("Retrieved %d available data categories", len(response['results']))
             return response['results']
         return []
     
@@ -142,10 +455,151 @@ class NOAAWeatherConnector:
         
         response = self._make_request('stations', params)
         if response and 'results' in response:
-            logger.info(f"Retrieved {len(response['results'])} weather stations")
+            logger.info("Retrieved %d weather stations", len(response['results']))
             return response['results']
         return []
     
+    def _data_params(
+        self,
+        dataset_id: str,
+        start_date: Union[str, datetime.datetime],
+        end_date: Union[str, datetime.datetime],
+        station_id: Optional[str] = None,
+        data_type_id: Optional[str] = None,
+        location_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Build the query parameters for the data endpoint
+        """
+        # Convert dates to strings if they are datetime objects
+        if isinstance(start_date, datetime.datetime):
+            start_date = start_date.strftime('%Y-%m-%d')
+        if isinstance(end_date, datetime.datetime):
+            end_date = end_date.strftime('%Y-%m-%d')
+        
+        params = {
+            'datasetid': dataset_id,
+            'startdate': start_date,
+            'enddate': end_date
+        }
+        
+        if station_id:
+            params['stationid'] = station_id
+        
+        if data_type_id:
+            params['datatypeid'] = data_type_id
+        
+        if location_id:
+            params['locationid'] = location_id
+        
+        return params
+    
+    def get_data_iter(
+        self,
+        dataset_id: str,
+        start_date: Union[str, datetime.datetime],
+        end_date: Union[str, datetime.datetime],
+        station_id: Optional[str] = None,
+        data_type_id: Optional[str] = None,
+        location_id: Optional[str] = None,
+        page_size: int = 1000
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Page through weather data one request at a time
+        
+        Args:
+            dataset_id: Dataset identifier (e.g., 'GHCND')
+            start_date: Start date for data retrieval
+            end_date: End date for data retrieval
+            station_id: Filter by weather station ID
+            data_type_id: Filter by data type ID
+            location_id: Filter by location ID
+            page_size: Results per request (the CDO API allows at most 1000)
+            
+        Yields:
+            Lists of data records, one per page
+        """
+        params = self._data_params(dataset_id, start_date, end_date, station_id, data_type_id, location_id)
+        params['limit'] = page_size
+        
+        offset = 1  # CDO offsets are 1-based
+        while True:
+            response = self._make_request('data', {**params, 'offset': offset})
+            if not response or not response.get('results'):
+                return
+            
+            yield response['results']
+            
+            if len(response['results']) < page_size:
+                return
+            offset += page_size
+    
+    def get_data_arrow(
+        self,
+        dataset_id: str,
+        start_date: Union[str, datetime.datetime],
+        end_date: Union[str, datetime.datetime],
+        station_id: Optional[str] = None,
+        data_type_id: Optional[str] = None,
+        location_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        page_size: int = 1000,
+        max_workers: int = 8
+    ) -> pa.Table:
+        """
+        Get weather data for a specific dataset and parameters as an Arrow table
+        
+        The first page reports how many results match; the remaining pages
+        are then requested concurrently over the shared session.
+        
+        Args:
+            dataset_id: Dataset identifier (e.g., 'GHCND' for Global Historical Climatology Network Daily)
+            start_date: Start date for data retrieval
+            end_date: End date for data retrieval
+            station_id: Filter by weather station ID
+            data_type_id: Filter by data type ID
+            location_id: Filter by location ID
+            limit: Maximum number of results (all matching results if None)
+            page_size: Results per request (the CDO API allows at most 1000)
+            max_workers: Maximum number of pages requested at once
+            
+        Returns:
+            Arrow table with the DATA_SCHEMA columns (empty if nothing was retrieved)
+        """
+        params = self._data_params(dataset_id, start_date, end_date, station_id, data_type_id, location_id)
+        if limit is not None:
+            page_size = min(page_size, limit)
+        params['limit'] = page_size
+        
+        response = self._make_request('data', {**params, 'offset': 1})
+        
+        if not response or not response.get('results'):
+            logger.warning("No data retrieved")
+            return DATA_SCHEMA.empty_table()
+        
+        results = list(response['results'])
+        total = response.get('metadata', {}).get('resultset', {}).get('count', len(results))
+        if limit is not None:
+            total = min(total, limit)
+        
+        offsets = range(len(results) + 1, total + 1, page_size)
+        if offsets:
+            def fetch_page(offset: int) -> List[Dict[str, Any]]:
+                page = self._make_request('data', {**params, 'offset': offset})
+                if not page or 'results' not in page:
+                    logger.warning("Failed to retrieve data page at offset %d", offset)
+                    return []
+                return page['results']
+            
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(offsets))) as executor:
+                for page in executor.map(fetch_page, offsets):
+                    results.extend(page)
+        
+        del results[total:]
+        
+        logger.info("Retrieved %d data points", len(results))
+        return _data_table(results)
+    
     def get_data(
         self,
         dataset_id: str,
@@ -154,7 +608,9 @@ class NOAAWeatherConnector:
         station_id: Optional[str] = None,
         data_type_id: Optional[str] = None,
         location_id: Optional[str] = None,
-        limit: int = 1000
+        limit: Optional[int] = None,
+        page_size: int = 1000,
+        max_workers: int = 8
     ) -> pd.DataFrame:
         """
         Get weather data for a specific dataset and parameters
@@ -166,7 +622,41 @@ class NOAAWeatherConnector:
             station_id: Filter by weather station ID
             data_type_id: Filter by data type ID
             location_id: Filter by location ID
-            limit: Maximum number of results
+            limit: Maximum number of results (all matching results if None)
+            page_size: Results per request (the CDO API allows at most 1000)
+            max_workers: Maximum number of pages requested at once
+            
+        Returns:
+            Pandas DataFrame containing the requested data
+        """
+        table = self.get_data_arrow(
+            dataset_id, start_date, end_date, station_id, data_type_id,
+            location_id, limit, page_size, max_workers
+        )
+        if table.num_rows == 0:
+            return pd.DataFrame()
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+    
+    def get_data_bulk(
+        self,
+        dataset_id: str,
+        start_date: Union[str, datetime.datetime],
+        end_date: Union[str, datetime.datetime],
+        station_ids: List[str],
+        data_type_ids: Optional[List[str]] = None,
+        page_size: int = 1000
+    ) -> pd.DataFrame:
+        """
+        Get weather data for several stations and data types in one query,
+        following the API's pagination until every result has been read
+        
+        Args:
+            dataset_id: Dataset identifier (e.g., 'GHCND')
+            start_date: Start date for data retrieval
+            end_date: End date for data retrieval
+            station_ids: Weather station IDs, sent as repeated stationid parameters
+            data_type_ids: Data type IDs, sent as repeated datatypeid parameters
+            page_size: Results per request (the CDO API allows at most 1000)
             
         Returns:
             Pandas DataFrame containing the requested data
@@ -181,27 +671,157 @@ class NOAAWeatherConnector:
             'datasetid': dataset_id,
             'startdate': start_date,
             'enddate': end_date,
-            'limit': limit
+            'stationid': list(station_ids),
+            'limit': page_size
         }
         
-        if station_id:
-            params['stationid'] = station_id
-        
-        if data_type_id:
-            params['datatypeid'] = data_type_id
-        
-        if location_id:
-            params['locationid'] = location_id
+        if data_type_ids:
+            params['datatypeid'] = list(data_type_ids)
         
-        response = self._make_request('data', params)
+        results = []
+        offset = 1  # CDO offsets are 1-based
+        while True:
+            response = self._make_request('data', {**params, 'offset': offset})
+            if not response or 'results' not in response:
+                break
+            
+            results.extend(response['results'])
+            
+            total = response.get('metadata', {}).get('resultset', {}).get('count', 0)
+            offset += len(response['results'])
+            if not response['results'] or offset > total:
+                break
         
-        if response and 'results' in response:
-            logger.info(f"Retrieved {len(response['results'])} data points")
-            return pd.DataFrame(response['results'])
+        if results:
+            logger.info("Retrieved %d data points for %d stations", len(results), len(station_ids))
+            return _data_frame(results)
         
         logger.warning("No data retrieved")
         return pd.DataFrame()
     
+    async def iter_data_many_async(
+        self,
+        dataset_id: str,
+        start_date: Union[str, datetime.datetime],
+        end_date: Union[str, datetime.datetime],
+        station_ids: List[str],
+        data_type_ids: Optional[List[str]] = None,
+        page_size: int = 1000,
+        max_results: Optional[int] = None,
+        max_concurrency: int = 16,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> AsyncIterator[Tuple[str, pd.DataFrame]]:
+        """
+        Fetch weather data for many stations concurrently, yielding each
+        station's data as soon as it has arrived
+        
+        Args:
+            dataset_id: Dataset identifier (e.g., 'GHCND')
+            start_date: Start date for data retrieval
+            end_date: End date for data retrieval
+            station_ids: Weather station IDs, queried separately
+            data_type_ids: Data type IDs, sent as repeated datatypeid parameters
+            page_size: Results per request (the CDO API allows at most 1000)
+            max_results: Maximum number of results per station (all if None)
+            max_concurrency: Maximum number of requests in flight
+            semaphore: Semaphore capping requests instead of max_concurrency,
+                       to share one cap between several calls
+            
+        Yields:
+            (station ID, DataFrame) pairs in completion order; the frame is
+            empty where a request failed or returned nothing
+        """
+        # Convert dates to strings if they are datetime objects
+        if isinstance(start_date, datetime.datetime):
+            start_date = start_date.strftime('%Y-%m-%d')
+        if isinstance(end_date, datetime.datetime):
+            end_date = end_date.strftime('%Y-%m-%d')
+        
+        if max_results is not None:
+            page_size = min(page_size, max_results)
+        
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def fetch(client: httpx.AsyncClient, station_id: str) -> Tuple[str, pd.DataFrame]:
+            params = {
+                'datasetid': dataset_id,
+                'startdate': start_date,
+                'enddate': end_date,
+                'stationid': station_id,
+                'limit': page_size
+            }
+            if data_type_ids:
+                params['datatypeid'] = list(data_type_ids)
+            
+            results = []
+            offset = 1  # CDO offsets are 1-based
+            while max_results is None or len(results) < max_results:
+                async with semaphore:
+                    response = await self._make_request_async(client, 'data', {**params, 'offset': offset})
+                if not response or not response.get('results'):
+                    break
+                
+                results.extend(response['results'])
+                if len(response['results']) < page_size:
+                    break
+                offset += page_size
+            
+            if max_results is not None:
+                del results[max_results:]
+            return station_id, _data_frame(results) if results else pd.DataFrame()
+        
+        async with self._async_client(max_connections=max_concurrency) as client:
+            tasks = [asyncio.ensure_future(fetch(client, station_id)) for station_id in station_ids]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    yield await next_done
+            finally:
+                # Stop outstanding requests if the caller stops iterating early
+                for task in tasks:
+                    task.cancel()
+    
+    async def get_data_many_async(
+        self,
+        dataset_id: str,
+        start_date: Union[str, datetime.datetime],
+        end_date: Union[str, datetime.datetime],
+        station_ids: List[str],
+        data_type_id: Optional[str] = None,
+        limit: int = 1000,
+        max_concurrency: int = 16
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Get weather data for many stations concurrently from async code
+        
+        Args:
+            dataset_id: Dataset identifier (e.g., 'GHCND')
+            start_date: Start date for data retrieval
+            end_date: End date for data retrieval
+            station_ids: Weather station IDs, queried separately
+            data_type_id: Filter by data type ID
+            limit: Maximum number of results per station
+            max_concurrency: Maximum number of requests in flight
+            
+        Returns:
+            Dictionary mapping station IDs to DataFrames of their data
+            (empty where a request failed or returned nothing)
+        """
+        frames = {}
+        async for station_id, frame in self.iter_data_many_async(
+            dataset_id,
+            start_date,
+            end_date,
+            station_ids,
+            data_type_ids=[data_type_id] if data_type_id else None,
+            max_results=limit,
+            max_concurrency=max_concurrency
+        ):
+            frames[station_id] = frame
+        
+        logger.info("Retrieved %d data points for %d stations", sum(len(frame) for frame in frames.values()), len(station_ids))
+        return {station_id: frames[station_id] for station_id in station_ids}
+    
     def get_gridded_data(
         self,
         dataset: str = 'gfs-ani-history',  # GFS Analysis Historical
@@ -230,7 +850,7 @@ class NOAAWeatherConnector:
         # for a production system to handle the complexities of gridded data access
         
         logger.warning("get_gridded_data is a placeholder implementation")
-        logger.info(f"Would download {dataset} data for variables {variables}")
+        logger.info("Would download %s data for variables %s", dataset, variables)
         
         # In a real implementation, this would download NetCDF or GRIB files
         # from NOAA's NOMADS (NOAA Operational Model Archive and Distribution System)
@@ -245,7 +865,8 @@ class NOAAWeatherConnector:
         year: int = 2023,
         day_of_year: int = 1,
         hour: int = 0,
-        output_dir: Optional[str] = None
+        output_dir: Optional[str] = None,
+        channel: Optional[str] = 'C01'
     ) -> Optional[str]:
         """
         Download GOES satellite data from NOAA AWS bucket
@@ -257,9 +878,10 @@ class NOAAWeatherConnector:
             day_of_year: Day of year (1-366)
             hour: Hour (0-23)
             output_dir: Directory to save the downloaded data
+            channel: ABI channel to download (e.g. 'C01'), or None for any file
             
         Returns:
-            Path to the downloaded file
+            Path to the downloaded file (the first scan of the hour)
         """
         # Create output directory if it doesn't exist
         if not output_dir:
@@ -267,60 +889,267 @@ class NOAAWeatherConnector:
         else:
             os.makedirs(output_dir, exist_ok=True)
         
-        # Base URL for GOES data on AWS
-        base_url = f"https://noaa-goes{satellite[-2:]}.s3.amazonaws.com"
+        bucket = GOES_BUCKET_TEMPLATE.format(sat_num=satellite[-2:])
+        prefix = GOES_PREFIX_TEMPLATE.format(product=product, year=year, doy=day_of_year, hour=hour)
         
-        # Construct the URL for the specified product and time
-        url = f"{base_url}/{product}/{year}/{day_of_year:03d}/{hour:02d}/OR_{product}-M6C01_{satellite}_s{year}{day_of_year:03d}{hour:02d}00_e{year}{day_of_year:03d}{hour:02d}59_c{year}{day_of_year:03d}{hour+1:02d}10.nc"
+        try:
+            # Find the real object key; file names carry scan mode and timestamps
+            response = self.s3.list_objects_v2(Bucket=bucket, Prefix=prefix)
+            keys = [obj['Key'] for obj in response.get('Contents', [])]
+            if channel:
+                keys = [key for key in keys if f"{channel}_{satellite}_" in key]
+            
+            if not keys:
+                logger.warning("No GOES data found under s3://%s/%s", bucket, prefix)
+                return None
+            
+            key = min(keys)
+            output_path = os.path.join(output_dir, key.rsplit('/', 1)[-1])
+            
+            logger.info("Downloading GOES data from s3://%s/%s", bucket, key)
+            self.s3.download_file(bucket, key, output_path, Config=GOES_TRANSFER_CONFIG)
+            
+            logger.info("Downloaded GOES data to %s", output_path)
+            return output_path
         
-        logger.info(f"Downloading GOES data from {url}")
+        except (BotoCoreError, ClientError) as e:
+            logger.error("Error downloading GOES data: %s", e)
+            return None
+    
+    async def _list_goes_keys(self, client: httpx.AsyncClient, prefix: str) -> List[str]:
+        """
+        List the object keys under a prefix of a public GOES bucket
         
-        try:
-            # Download the file
-            response = requests.get(url, stream=True)
+        Args:
+            client: Client whose base URL is the bucket
+            prefix: Key prefix, e.g. 'ABI-L2-CMIPF/2023/001/00/'
+            
+        Returns:
+            Object keys under the prefix
+        """
+        keys = []
+        params = {'list-type': '2', 'prefix': prefix}
+        while True:
+            response = await client.get('/', params=params)
             response.raise_for_status()
             
-            # Save to file
-            output_path = os.path.join(output_dir, url.split('/')[-1])
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            root = ElementTree.fromstring(response.content)
+            keys.extend(element.text for element in root.iter(f"{S3_XML_NAMESPACE}Key"))
+            
+            token = root.findtext(f"{S3_XML_NAMESPACE}NextContinuationToken")
+            if not token:
+                return keys
+            params['continuation-token'] = token
+    
+    async def download_goes_range(
+        self,
+        product: str = 'ABI-L2-CMIPF',  # Cloud and Moisture Imagery
+        satellite: str = 'G16',  # GOES-16
+        year: int = 2023,
+        doy_range: Iterable[int] = range(1, 2),
+        hour_range: Iterable[int] = range(0, 24),
+        output_dir: Optional[str] = None,
+        channel: Optional[str] = 'C01',
+        concurrency: int = 16
+    ) -> List[str]:
+        """
+        Download GOES satellite data for many hours concurrently
+        
+        Files are discovered by listing each hour's prefix in the bucket rather
+        than guessing their names, so any scan mode and creation time is found.
+        
+        Args:
+            product: GOES product identifier
+            satellite: Satellite identifier (G16 or G17)
+            year: Year
+            doy_range: Days of year (1-366) to download
+            hour_range: Hours (0-23) to download
+            output_dir: Directory to save the downloaded data
+            channel: ABI channel to keep (e.g. 'C01'), or None to keep every file
+            concurrency: Maximum number of requests in flight
             
-            logger.info(f"Downloaded GOES data to {output_path}")
+        Returns:
+            Paths to the downloaded files
+        """
+        if not output_dir:
+            output_dir = tempfile.mkdtemp()
+        else:
+            os.makedirs(output_dir, exist_ok=True)
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def list_hour(client: httpx.AsyncClient, prefix: str) -> List[str]:
+            async with semaphore:
+                try:
+                    keys = await self._list_goes_keys(client, prefix)
+                except (httpx.HTTPError, ElementTree.ParseError) as e:
+                    logger.error("Error listing GOES data under %s: %s", prefix, e)
+                    return []
+            if channel:
+                keys = [key for key in keys if f"{channel}_{satellite}_" in key]
+            return keys
+        
+        async def download(client: httpx.AsyncClient, key: str) -> Optional[str]:
+            output_path = os.path.join(output_dir, key.rsplit('/', 1)[-1])
+            async with semaphore:
+                try:
+                    async with client.stream('GET', f"/{key}") as response:
+                        response.raise_for_status()
+                        with open(output_path, 'wb') as f:
+                            async for chunk in response.aiter_bytes(GOES_DOWNLOAD_CHUNK_SIZE):
+                                f.write(chunk)
+                except (httpx.HTTPError, OSError) as e:
+                    logger.error("Error downloading GOES data %s: %s", key, e)
+                    return None
             return output_path
         
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error downloading GOES data: {str(e)}")
-            return None
+        prefixes = [
+            GOES_PREFIX_TEMPLATE.format(product=product, year=year, doy=day_of_year, hour=hour)
+            for day_of_year in doy_range
+            for hour in hour_range
+        ]
+        
+        async with httpx.AsyncClient(
+            base_url=f"https://{GOES_BUCKET_TEMPLATE.format(sat_num=satellite[-2:])}.s3.amazonaws.com",
+            timeout=httpx.Timeout(60, connect=5),
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        ) as client:
+            listings = await asyncio.gather(*(list_hour(client, prefix) for prefix in prefixes))
+            keys = [key for listing in listings for key in listing]
+            paths = await asyncio.gather(*(download(client, key) for key in keys))
+        
+        downloaded = [path for path in paths if path]
+        logger.info("Downloaded %d of %d GOES files for %d hours", len(downloaded), len(keys), len(prefixes))
+        return downloaded
+    
+    def to_zarr_cache(
+        self,
+        nc_path: str,
+        zarr_root: Optional[str] = None,
+        engine: str = 'h5netcdf'
+    ) -> str:
+        """
+        Convert a NetCDF file to a compressed, chunked Zarr store once and reuse it
+        
+        Stores are named by a hash of the file's size and first bytes, so the
+        same file downloaded to another path maps to the same store.
+        
+        Args:
+            nc_path: Path to NetCDF file
+            zarr_root: Directory holding the Zarr stores (defaults to ZARR_CACHE_DIR)
+            engine: xarray backend used to read the NetCDF file
+            
+        Returns:
+            Path to the Zarr store
+        """
+        import xarray as xr
+        import numcodecs
+        
+        zarr_root = zarr_root or ZARR_CACHE_DIR
+        
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(str(os.path.getsize(nc_path)).encode())
+        with open(nc_path, 'rb') as f:
+            digest.update(f.read(ZARR_KEY_BYTES))
+        store_path = os.path.join(zarr_root, f"{digest.hexdigest()}.zarr")
+        
+        if os.path.isdir(store_path):
+            return store_path
+        
+        os.makedirs(zarr_root, exist_ok=True)
+        
+        # Write under a temporary name and rename, so a partial store is never reused
+        partial_path = f"{store_path}.{uuid.uuid4().hex}.incomplete"
+        compressor = numcodecs.Blosc(cname='zstd', clevel=3, shuffle=numcodecs.Blosc.BITSHUFFLE)
+        try:
+            with xr.open_dataset(nc_path, engine=engine, chunks=NETCDF_CHUNKS) as ds:
+                ds.to_zarr(
+                    partial_path,
+                    mode='w',
+                    consolidated=True,
+                    encoding={name: {'compressor': compressor} for name in ds.data_vars}
+                )
+            os.replace(partial_path, store_path)
+        except OSError:
+            # Another process finished the same store first
+            if not os.path.isdir(store_path):
+                raise
+        finally:
+            shutil.rmtree(partial_path, ignore_errors=True)
+        
+        logger.info("Converted NetCDF file %s to Zarr store %s", nc_path, store_path)
+        return store_path
     
     def process_netcdf(
         self,
         file_path: str,
-        variables: Optional[List[str]] = None
-    ) -> xr.Dataset:
+        variables: Optional[List[str]] = None,
+        engine: str = 'h5netcdf',
+        as_float32: bool = False,
+        *,
+        decode_times: bool = False,
+        drop: Optional[List[str]] = None,
+        use_zarr_cache: bool = False
+    ) -> 'xr.Dataset':
         """
         Process a NetCDF file into an xarray Dataset
         
+        The dataset is opened lazily with Dask chunks, so data is only read
+        (in parallel) when it is computed. Open datasets are cached per file,
+        so callers should not close the returned dataset.
+        
         Args:
             file_path: Path to NetCDF file
             variables: List of variable names to extract (if None, extract all)
+            engine: xarray backend; h5netcdf reads NetCDF4/HDF5 files such as GOES ABI,
+                    use 'netcdf4' or 'scipy' for classic NetCDF3 files
+            as_float32: Cast floating-point data variables (unpacked values) to float32
+            decode_times: Decode time variables to datetimes (left numeric by default)
+            drop: Further variables to skip when opening the file
+            use_zarr_cache: Read from a Zarr copy of the file (see to_zarr_cache),
+                            creating it on first use
             
         Returns:
             xarray Dataset containing the data
         """
         try:
-            # Open the NetCDF file as an xarray Dataset
-            ds = xr.open_dataset(file_path)
+            # Open the NetCDF file as a lazily loaded, chunked xarray Dataset
+            path = os.path.abspath(file_path)
             
-            # Filter variables if specified
+            # When only some variables are wanted, skip the product's known
+            # ancillary variables so their metadata is never read
+            drop_variables = set(drop or [])
+            if variables:
+                drop_variables.update(set(_aux_variables(path)) - set(variables))
+            
+            if use_zarr_cache:
+                import xarray as xr
+                
+                ds = xr.open_zarr(
+                    self.to_zarr_cache(path, engine=engine),
+                    consolidated=True,
+                    decode_times=decode_times,
+                    drop_variables=sorted(drop_variables) or None
+                )
+            else:
+                ds = _open_netcdf(path, os.path.getmtime(path), engine, decode_times, tuple(sorted(drop_variables)))
+            
+            # Filter variables if specified; nothing has been read yet, so this is cheap
             if variables:
                 ds = ds[variables]
             
-            logger.info(f"Processed NetCDF file {file_path} with variables {list(ds.data_vars.keys())}")
+            if as_float32:
+                ds = ds.assign({
+                    name: var.astype('float32')
+                    for name, var in ds.data_vars.items()
+                    if var.dtype.kind == 'f'
+                })
+            
+            logger.info("Processed NetCDF file %s with variables %s", file_path, list(ds.data_vars))
             return ds
         
         except Exception as e:
-            logger.error(f"Error processing NetCDF file {file_path}: {str(e)}")
+            logger.error("Error processing NetCDF file %s: %s", file_path, e)
             raise
 
 
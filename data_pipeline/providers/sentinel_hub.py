@@ -1,24 +1,51 @@
 import os
 import logging
 import datetime
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Tuple, Any, Union
 import requests
+import httpx
+import pandas as pd
+from requests.adapters import HTTPAdapter
 from sentinelsat import SentinelAPI, geojson_to_wkt, read_geojson
 from pathlib import Path
 import tempfile
 import shutil
-import geopandas as gpd
-from shapely.geometry import box, shape
-import rasterio
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Copy size for streaming product archives (hundreds of MB each) to disk
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=16)
+def _load_wkt(path: str, mtime: float) -> str:
+    """
+    Read a GeoJSON file as a WKT footprint, cached per file version
+    """
+    return geojson_to_wkt(read_geojson(path))
+
+def products_to_dataframe(products: Dict[str, Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Convert search results to a DataFrame with one row per product
+    
+    Builds the rows directly with orient='index' rather than transposing
+    pd.DataFrame(products), which would turn every column into object dtype.
+    
+    Args:
+        products: Products keyed by product ID, as returned by search_products
+        
+    Returns:
+        DataFrame indexed by product ID with columns sorted by name
+    """
+    return pd.DataFrame.from_dict(products, orient='index').sort_index(axis='columns')
+
 class SentinelHubConnector:
     """
     Connector for Sentinel Hub / Copernicus Open Access Hub
@@ -29,7 +56,10 @@ class SentinelHubConnector:
         self,
         user: Optional[str] = None,
         password: Optional[str] = None,
-        api_url: str = 'https://scihub.copernicus.eu/dhus'
+        api_url: str = 'https://scihub.copernicus.eu/dhus',
+        pool_maxsize: int = 16,
+        session: Optional[requests.Session] = None,
+        max_concurrent_downloads: int = 2
     ):
         """
         Initialize the Sentinel Hub connector
@@ -38,7 +68,14 @@ class SentinelHubConnector:
             user: Username for Sentinel Hub (defaults to env var SENTINEL_HUB_USER)
             password: Password for Sentinel Hub (defaults to env var SENTINEL_HUB_PASSWORD)
             api_url: URL for the Sentinel API
+            pool_maxsize: Keep-alive connections kept open to the API host, which
+                should cover the number of concurrent searches and downloads
+            session: Session whose connection adapters (pools and retry policy)
+                should be shared; credentials stay on the connector's own session
+            max_concurrent_downloads: Downloads the hub allows per account at once
+                (2 for standard SciHub users, 4 on Copernicus Data Space)
         """
+        self.max_concurrent_downloads = max_concurrent_downloads
         self.user = user or os.getenv('SENTINEL_HUB_USER')
         self.password = password or os.getenv('SENTINEL_HUB_PASSWORD')
         self.api_url = api_url
@@ -48,11 +85,46 @@ class SentinelHubConnector:
         else:
             try:
                 self.api = SentinelAPI(self.user, self.password, self.api_url)
+                
+                # SentinelAPI keeps one requests.Session for every call; size its
+                # pool so concurrent downloads reuse connections instead of
+                # discarding them and paying a new TLS handshake each time
+                if session is not None:
+                    for prefix, adapter in session.adapters.items():
+                        self.api.session.mount(prefix, adapter)
+                else:
+                    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize)
+                    self.api.session.mount('https://', adapter)
+                    self.api.session.mount('http://', adapter)
+                
                 logger.info(f"Initialized Sentinel Hub connector for {self.api_url}")
             except Exception as e:
                 logger.error(f"Failed to initialize Sentinel Hub connector: {str(e)}")
                 self.api = None
     
+    @functools.cached_property
+    def http2(self) -> httpx.Client:
+        """
+        HTTP/2 client for the OData endpoint, created on first use
+        
+        Parallel downloads are multiplexed over a few TLS connections
+        instead of one HTTP/1.1 connection each.
+        """
+        return httpx.Client(
+            http2=True,
+            auth=(self.user, self.password),
+            timeout=httpx.Timeout(30.0, read=600.0),
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+            follow_redirects=True
+        )
+    
+    def close(self) -> None:
+        """
+        Close the HTTP/2 client if it was created
+        """
+        if 'http2' in self.__dict__:
+            self.http2.close()
+    
     def search_products(
         self,
         bbox: Optional[List[float]] = None,  # [min_lon, min_lat, max_lon, max_lat]
@@ -85,9 +157,9 @@ class SentinelHubConnector:
         try:
             # Convert dates to datetime objects if they are strings
             if isinstance(start_date, str):
-                start_date = datetime.datetime.strptime(start_date, '%Y-%m-%d')
+                start_date = datetime.datetime.fromisoformat(start_date)
             if isinstance(end_date, str):
-                end_date = datetime.datetime.strptime(end_date, '%Y-%m-%d')
+                end_date = datetime.datetime.fromisoformat(end_date)
             
             # Set default date range if not provided
             if not start_date:
@@ -97,9 +169,10 @@ class SentinelHubConnector:
             
             # Define area of interest
             if geojson_path and os.path.exists(geojson_path):
-                footprint = geojson_to_wkt(read_geojson(geojson_path))
+                footprint = _load_wkt(os.path.abspath(geojson_path), os.path.getmtime(geojson_path))
             elif bbox:
-                footprint = geojson_to_wkt(gpd.GeoDataFrame([1], geometry=[box(*bbox)], crs='EPSG:4326').__geo_interface__)
+                # A bbox is a closed rectangle, so write its WKT directly
+                footprint = "POLYGON(({0} {1},{2} {1},{2} {3},{0} {3},{0} {1}))".format(*bbox)
             else:
                 logger.error("Either bbox or geojson_path must be provided")
                 return {}
@@ -116,20 +189,19 @@ class SentinelHubConnector:
             # Execute the query
             products = self.api.query(**query_kwargs)
             
-            # Get product details
-            products_df = self.api.to_dataframe(products)
-            
-            if products_df.empty:
+            if not products:
                 logger.info("No products found matching the criteria")
                 return {}
             
-            # Sort by cloud cover and limit results
-            products_df = products_df.sort_values('cloudcoverpercentage').head(max_results)
+            # Sort by cloud cover and limit results; products is already keyed by product ID
+            best = sorted(
+                products.items(),
+                key=lambda item: item[1].get('cloudcoverpercentage', 100.0)
+            )[:max_results]
             
-            logger.info(f"Found {len(products_df)} Sentinel products matching the criteria")
+            logger.info(f"Found {len(best)} Sentinel products matching the criteria")
             
-            # Convert to dictionary
-            return products_df.to_dict('index')
+            return dict(best)
         
         except Exception as e:
             logger.error(f"Error searching Sentinel products: {str(e)}")
@@ -182,6 +254,82 @@ class SentinelHubConnector:
             logger.error(f"Error downloading product {product_id}: {str(e)}")
             return None
     
+    def download_product_http2(
+        self,
+        product_id: str,
+        output_dir: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Download a Sentinel product archive over the HTTP/2 client
+        
+        Args:
+            product_id: ID of the product to download
+            output_dir: Directory to save the downloaded product
+            
+        Returns:
+            Path to the downloaded product
+        """
+        if self.api is None:
+            logger.error("Sentinel Hub API not initialized. Check credentials.")
+            return None
+        
+        try:
+            # Create temporary directory if output_dir not provided
+            if not output_dir:
+                output_dir = tempfile.mkdtemp()
+            else:
+                os.makedirs(output_dir, exist_ok=True)
+            
+            product_info = self.api.get_product_odata(product_id)
+            download_path = os.path.join(output_dir, f"{product_info['title']}.zip")
+            
+            logger.info(f"Downloading product {product_id} to {output_dir}")
+            
+            # Write to a temporary name so a failed transfer never looks complete
+            partial_path = f"{download_path}.incomplete"
+            with self.http2.stream('GET', product_info['url']) as response:
+                response.raise_for_status()
+                with open(partial_path, 'wb') as f:
+                    for chunk in response.iter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+            os.replace(partial_path, download_path)
+            
+            logger.info(f"Downloaded product {product_id} to {download_path}")
+            return download_path
+        
+        except Exception as e:
+            logger.error(f"Error downloading product {product_id}: {str(e)}")
+            return None
+    
+    def download_products(
+        self,
+        product_ids: List[str],
+        output_dir: Optional[str] = None,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Optional[str]]:
+        """
+        Download several Sentinel products in parallel, sharing the HTTP/2 client
+        
+        Args:
+            product_ids: IDs of the products to download
+            output_dir: Directory to save the downloaded products
+            max_workers: Number of parallel downloads, capped at max_concurrent_downloads
+            
+        Returns:
+            Dictionary mapping product IDs to download paths (None where a download failed)
+        """
+        if not product_ids:
+            return {}
+        
+        workers = min(max_workers or self.max_concurrent_downloads, self.max_concurrent_downloads, len(product_ids))
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.download_product_http2, product_id, output_dir): product_id
+                for product_id in product_ids
+            }
+            return {futures[future]: future.result() for future in as_completed(futures)}
+    
     def get_quicklook(
         self,
         product_id: str,
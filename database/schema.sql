@@ -121,6 +121,13 @@ CREATE INDEX idx_weather_data_timestamp ON weather_data(timestamp);
 CREATE INDEX idx_weather_data_type ON weather_data(data_type);
 CREATE INDEX idx_weather_data_source_id ON weather_data(source_id);
 CREATE INDEX idx_weather_data_location ON weather_data USING GIST(location);
+-- Geography expression index for meter-based radius queries (ST_DWithin on location::geography)
+CREATE INDEX idx_weather_data_location_geog ON weather_data USING GIST((location::geography));
+-- Time-range scans: BRIN stays tiny on this append-only table; run VACUUM ANALYZE
+-- after bulk loads so the block range summaries cover new rows
+CREATE INDEX idx_weather_data_timestamp_brin ON weather_data USING BRIN(timestamp) WITH (pages_per_range = 32);
+-- Stats and heatmap queries filter on data_type plus a timestamp range
+CREATE INDEX idx_weather_data_type_timestamp ON weather_data(data_type, timestamp);
 
 -- Anomaly types
 CREATE TABLE anomaly_types (
@@ -0,0 +1,37 @@
+-- Optional TimescaleDB setup for VisionEarth
+-- Run after schema.sql on a server with the timescaledb extension available,
+-- then set WEATHER_HOURLY_AGGREGATE=true for the backend.
+
+CREATE EXTENSION IF NOT EXISTS timescaledb;
+
+-- Hypertable unique constraints must include the partitioning column
+ALTER TABLE weather_data DROP CONSTRAINT weather_data_pkey;
+ALTER TABLE weather_data ADD PRIMARY KEY (id, timestamp);
+SELECT create_hypertable('weather_data', 'timestamp', migrate_data => true);
+
+-- Hourly rollup per data type and location. Sums and counts (not averages) are
+-- stored so statistics can be re-aggregated into daily/weekly/monthly buckets
+-- and over any bounding box. Real-time aggregation covers rows newer than the
+-- last refresh.
+CREATE MATERIALIZED VIEW weather_hourly
+WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+SELECT
+    time_bucket('1 hour', timestamp) AS bucket,
+    data_type,
+    location,
+    SUM(value) AS value_sum,
+    MIN(value) AS value_min,
+    MAX(value) AS value_max,
+    COUNT(*) AS value_count,
+    MAX(unit) AS unit
+FROM weather_data
+GROUP BY bucket, data_type, location
+WITH NO DATA;
+
+CREATE INDEX idx_weather_hourly_type_bucket ON weather_hourly(data_type, bucket);
+CREATE INDEX idx_weather_hourly_location ON weather_hourly USING GIST(location);
+
+SELECT add_continuous_aggregate_policy('weather_hourly',
+    start_offset => INTERVAL '2 days',
+    end_offset => INTERVAL '1 hour',
+    schedule_interval => INTERVAL '1 hour');